@@ -1,7 +1,11 @@
+from itertools import chain
+
 from django.contrib import admin
-from django.db.models import Count
+from django.db.models import Count, Sum
 
-from .models import Visit
+from .models import Visit, VisitDailyRollup
+from .paginator import EstimatedCountPaginator
+from .rollups import pending_visits
 
 
 @admin.register(Visit)
@@ -9,17 +13,30 @@ class VisitAdmin(admin.ModelAdmin):
     date_hierarchy = "created_at"
     list_display = ("created_at", "country_code", "device_type", "url")
     list_filter = ("country_code", "device_type", "created_at")
-    search_fields = ("url",)
+    list_select_related = ("url",)
+    search_fields = ("url__path",)
     ordering = ("-created_at",)
     change_list_template = "admin/analytics/visit/change_list.html"
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     def changelist_view(self, request, extra_context=None):
         extra_context = extra_context or {}
 
-        qs = Visit.objects.all()
+        # Totals, the device split and the per-country ranking all come from
+        # (country, device) counts: completed days are read from the daily
+        # rollup, the remainder from live visits. Top pages use one more pass.
+        rolled_up = VisitDailyRollup.objects.values("country_code", "device_type").annotate(visits=Sum("visits"))
+        live = pending_visits().values("country_code", "device_type").annotate(visits=Count("id"))
+
+        country_totals = {}
+        device_counts = {}
+        for row in chain(rolled_up, live):
+            code = row["country_code"]
+            country_totals[code] = country_totals.get(code, 0) + row["visits"]
+            device_counts[row["device_type"]] = device_counts.get(row["device_type"], 0) + row["visits"]
 
-        total_visits = qs.count()
-        device_counts = {row["device_type"]: row["visits"] for row in qs.values("device_type").annotate(visits=Count("id"))}
+        total_visits = sum(country_totals.values())
         mobile_visits = int(device_counts.get(Visit.DeviceType.MOBILE, 0))
         desktop_visits = int(device_counts.get(Visit.DeviceType.DESKTOP, 0))
         total_device = mobile_visits + desktop_visits
@@ -31,23 +48,28 @@ class VisitAdmin(admin.ModelAdmin):
             mobile_pct = 0
             desktop_pct = 0
 
-        countries = list(
-            qs.values("country_code")
-            .annotate(visits=Count("id"))
-            .order_by("-visits")
-        )
+        countries = [
+            {"country_code": code, "visits": visits}
+            for code, visits in sorted(country_totals.items(), key=lambda item: -item[1])
+        ]
         top_countries = countries[:5]
 
-        top_pages_by_country = []
-        for row in top_countries:
-            code = row["country_code"]
-            pages = list(
-                qs.filter(country_code=code)
-                .values("url")
+        pages_by_country = {row["country_code"]: [] for row in top_countries}
+        if pages_by_country:
+            page_rows = (
+                Visit.objects.filter(country_code__in=list(pages_by_country))
+                .values("country_code", "url__path")
                 .annotate(visits=Count("id"))
-                .order_by("-visits")[:5]
+                .order_by("country_code", "-visits")
             )
-            top_pages_by_country.append({"country_code": code, "pages": pages})
+            for row in page_rows:
+                pages = pages_by_country[row["country_code"]]
+                if len(pages) < 5:
+                    pages.append({"url": row["url__path"], "visits": row["visits"]})
+
+        top_pages_by_country = [
+            {"country_code": code, "pages": pages} for code, pages in pages_by_country.items()
+        ]
 
         extra_context.update(
             {
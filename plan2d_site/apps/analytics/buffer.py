@@ -0,0 +1,112 @@
+"""Buffered, off-request-path persistence for ``Visit`` rows.
+
+The middleware only enqueues unsaved ``Visit`` instances; a single daemon
+thread per process drains the queue and writes them with ``bulk_create``.
+Under load many visits share one INSERT, and the response never waits on it.
+Queued visits are written out when the process exits (gunicorn workers exit
+through ``sys.exit`` on restart or recycling, which runs ``atexit`` hooks).
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+
+from django.db import IntegrityError, close_old_connections
+
+from .models import Url, Visit
+from .utils import get_url_id
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+# Seconds the exit hook waits for the writer to finish the queue.
+SHUTDOWN_TIMEOUT = 10
+
+# Queued by the exit hook to tell the writer to drain and stop.
+_STOP = object()
+
+_VISIT_QUEUE: "queue.SimpleQueue[Visit]" = queue.SimpleQueue()
+_writer_lock = threading.Lock()
+_writer_thread: threading.Thread | None = None
+
+
+def enqueue_visit(visit: Visit) -> None:
+    """Queue an unsaved visit for the background writer."""
+    _VISIT_QUEUE.put(visit)
+
+
+def start_writer() -> None:
+    """Start the background writer thread once per process."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is not None and _writer_thread.is_alive():
+            return
+        _writer_thread = threading.Thread(
+            target=_write_forever,
+            name="analytics-visit-writer",
+            daemon=True,
+        )
+        _writer_thread.start()
+        atexit.register(_stop_writer, _writer_thread)
+
+
+def _stop_writer(thread: threading.Thread) -> None:
+    """Exit hook: let the writer flush what is queued, then stop."""
+    if thread.is_alive():
+        _VISIT_QUEUE.put(_STOP)
+        thread.join(SHUTDOWN_TIMEOUT)
+
+
+def drain(block: bool = True) -> list[Visit]:
+    """Pop up to ``BATCH_SIZE`` queued visits (waiting for the first if ``block``)."""
+    batch: list[Visit] = []
+    try:
+        batch.append(_VISIT_QUEUE.get(block=block))
+        while len(batch) < BATCH_SIZE:
+            batch.append(_VISIT_QUEUE.get_nowait())
+    except queue.Empty:
+        pass
+    return batch
+
+
+def flush(batch: list[Visit]) -> None:
+    if not batch:
+        return
+    try:
+        try:
+            Visit.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+        except IntegrityError:
+            # A stale cached url id (e.g. from a rolled-back get_or_create)
+            # fails the whole INSERT; retry without the affected visits.
+            batch = _without_unknown_urls(batch)
+            if batch:
+                Visit.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+    except Exception:
+        # Analytics must never take the site down; drop the batch.
+        logger.exception("Failed to write %d analytics visits", len(batch))
+    finally:
+        close_old_connections()
+
+
+def _without_unknown_urls(batch: list[Visit]) -> list[Visit]:
+    known = set(
+        Url.objects.filter(pk__in={visit.url_id for visit in batch}).values_list("pk", flat=True)
+    )
+    kept = [visit for visit in batch if visit.url_id in known]
+    if len(kept) < len(batch):
+        get_url_id.cache_clear()
+        logger.warning("Dropped %d analytics visits with unknown url ids", len(batch) - len(kept))
+    return kept
+
+
+def _write_forever() -> None:
+    while True:
+        batch = drain(block=True)
+        if any(visit is _STOP for visit in batch):
+            flush([visit for visit in batch if visit is not _STOP])
+            while batch := drain(block=False):
+                flush(batch)
+            return
+        flush(batch)
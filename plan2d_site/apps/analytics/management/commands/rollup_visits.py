@@ -0,0 +1,73 @@
+"""
+Management command to roll completed days of visits up into VisitDailyRollup.
+Schedule it nightly (e.g. a Render cron job shortly after midnight UTC).
+
+Usage:
+    python manage.py rollup_visits
+    python manage.py rollup_visits --date 2026-01-31
+
+--date rebuilds a day that is already rolled up, or the next pending one; it
+refuses later days, since skipping a day would hide its visits from the
+dashboard (see rollups.pending_visits).
+"""
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.analytics.rollups import next_pending_day, rollup_day
+
+
+class Command(BaseCommand):
+    help = 'Aggregate completed days of visits into daily rollup rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--date',
+            type=str,
+            help='Rebuild a single day (YYYY-MM-DD) instead of every pending day',
+        )
+
+    def handle(self, *args, **options):
+        if options.get('date'):
+            try:
+                day = datetime.date.fromisoformat(options['date'])
+            except ValueError as exc:
+                raise CommandError(f"Invalid --date: {exc}")
+            self._check_day(day)
+            days = [day]
+        else:
+            days = self._pending_days()
+
+        if not days:
+            self.stdout.write(self.style.SUCCESS("✓ Rollups are up to date"))
+            return
+
+        for day in days:
+            visits = rollup_day(day)
+            self.stdout.write(f"  {day}: {visits} visit(s)")
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Rolled up {len(days)} day(s)"))
+
+    def _check_day(self, day):
+        if day >= timezone.localdate():
+            raise CommandError(f"{day} is not a completed day yet")
+        next_day = next_pending_day()
+        if next_day is not None and day > next_day:
+            raise CommandError(
+                f"Cannot roll up {day} before {next_day}; run without --date "
+                "to roll up every pending day in order"
+            )
+
+    def _pending_days(self):
+        # Every completed day after the last rollup; today is still changing.
+        yesterday = timezone.localdate() - datetime.timedelta(days=1)
+        start = next_pending_day()
+        if start is None:
+            return []
+
+        days = []
+        while start <= yesterday:
+            days.append(start)
+            start += datetime.timedelta(days=1)
+        return days
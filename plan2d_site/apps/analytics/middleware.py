@@ -3,8 +3,15 @@ from __future__ import annotations
 from django.conf import settings
 from django.core.cache import cache
 
+from .buffer import enqueue_visit, start_writer
 from .models import Visit
-from .utils import detect_device_type, get_country_code_from_request, get_client_ip, hash_request_fingerprint
+from .utils import (
+    detect_device_type,
+    get_client_ip,
+    get_country_code_from_request,
+    get_url_id,
+    hash_request_fingerprint,
+)
 
 
 class VisitTrackingMiddleware:
@@ -14,7 +21,9 @@ class VisitTrackingMiddleware:
     Does NOT store IP address, cookies, names, emails, or identifiers.
 
     To avoid excessive writes, it throttles repeat hits from the same
-    fingerprint to the same path within a short window.
+    fingerprint to the same path within a short window. Rows are handed to a
+    background writer (see ``buffer.py``) and inserted in batches, unless
+    ``ANALYTICS_BUFFERED_WRITES`` is disabled.
     """
 
     EXCLUDED_PREFIXES = (
@@ -23,13 +32,26 @@ class VisitTrackingMiddleware:
         settings.MEDIA_URL or "/media/",
     )
 
+    # Obvious non-page URLs (exact match).
+    EXCLUDED_PATHS = frozenset({"/favicon.ico", "/robots.txt"})
+
     def __init__(self, get_response):
         self.get_response = get_response
+        # str.startswith() takes a tuple natively; drop empty prefixes, which
+        # would otherwise match every path.
+        self.excluded_prefixes = tuple(prefix for prefix in self.EXCLUDED_PREFIXES if prefix)
+        # Middleware is built once per worker process, so settings are read
+        # here rather than through LazySettings on every request.
+        self.enabled = bool(getattr(settings, "ANALYTICS_ENABLED", True))
+        self.throttle_seconds = int(getattr(settings, "ANALYTICS_THROTTLE_SECONDS", 60))
+        self.buffered = bool(getattr(settings, "ANALYTICS_BUFFERED_WRITES", True))
+        if self.buffered:
+            start_writer()
 
     def __call__(self, request):
         response = self.get_response(request)
 
-        if not getattr(settings, "ANALYTICS_ENABLED", True):
+        if not self.enabled:
             return response
 
         if request.method != "GET":
@@ -40,32 +62,31 @@ class VisitTrackingMiddleware:
             return response
 
         path = request.path or "/"
-        if any(path.startswith(prefix) for prefix in self.EXCLUDED_PREFIXES):
-            return response
-
-        # Skip obvious non-page URLs.
-        if path in ("/favicon.ico", "/robots.txt"):
+        if path in self.EXCLUDED_PATHS or path.startswith(self.excluded_prefixes):
             return response
 
-        throttle_seconds = int(getattr(settings, "ANALYTICS_THROTTLE_SECONDS", 60))
+        throttle_seconds = self.throttle_seconds
 
         user_agent = request.META.get("HTTP_USER_AGENT", "")
         ip = get_client_ip(request)
         fingerprint = hash_request_fingerprint(ip, user_agent)
         cache_key = f"visit:{fingerprint}:{path}"
 
-        if throttle_seconds > 0 and cache.get(cache_key):
+        # cache.add() only stores when the key is absent (SET NX on Redis), so a
+        # single atomic call both checks and claims the throttle slot.
+        if throttle_seconds > 0 and not cache.add(cache_key, True, timeout=throttle_seconds):
             return response
 
-        if throttle_seconds > 0:
-            cache.set(cache_key, True, timeout=throttle_seconds)
-
         try:
-            Visit.objects.create(
-                url=path,
+            visit = Visit(
+                url_id=get_url_id(path),
                 country_code=get_country_code_from_request(request),
                 device_type=detect_device_type(user_agent),
             )
+            if self.buffered:
+                enqueue_visit(visit)
+            else:
+                visit.save()
         except Exception:
             # Never block page rendering due to analytics.
             return response
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:55
+
+from django.db import migrations, models
+
+
+BRIN_INDEX_NAME = 'analytics_visit_created_at_brin'
+
+
+def create_brin_index(apps, schema_editor):
+    # BRIN is PostgreSQL-only; other backends simply lose the B-tree.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {BRIN_INDEX_NAME} '
+        'ON analytics_visit USING brin (created_at) WITH (pages_per_range = 32)'
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {BRIN_INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='visit',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.RunPython(create_brin_index, reverse_code=drop_brin_index),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_url_dimension(apps, schema_editor):
+    Url = apps.get_model('analytics', 'Url')
+    Visit = apps.get_model('analytics', 'Visit')
+
+    paths = Visit.objects.order_by().values_list('url', flat=True).distinct()
+    for path in paths.iterator(chunk_size=2000):
+        url = Url.objects.create(path=path)
+        Visit.objects.filter(url=path).update(url_ref=url)
+
+
+def restore_url_paths(apps, schema_editor):
+    Url = apps.get_model('analytics', 'Url')
+    Visit = apps.get_model('analytics', 'Visit')
+
+    for url in Url.objects.iterator(chunk_size=2000):
+        Visit.objects.filter(url_ref=url).update(url=url.path)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_visit_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Url',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(max_length=500, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='visit',
+            name='url_ref',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='analytics.url'),
+        ),
+        migrations.RunPython(populate_url_dimension, reverse_code=restore_url_paths),
+        migrations.RemoveIndex(
+            model_name='visit',
+            name='analytics_v_url_9cc0cc_idx',
+        ),
+        # A default lets the reverse migration re-add the column on a non-empty table.
+        migrations.AlterField(
+            model_name='visit',
+            name='url',
+            field=models.CharField(db_index=True, default='', max_length=500),
+        ),
+        migrations.RemoveField(
+            model_name='visit',
+            name='url',
+        ),
+        migrations.RenameField(
+            model_name='visit',
+            old_name='url_ref',
+            new_name='url',
+        ),
+        migrations.AlterField(
+            model_name='visit',
+            name='url',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='visits', to='analytics.url'),
+        ),
+        migrations.AddIndex(
+            model_name='visit',
+            index=models.Index(fields=['url', 'created_at'], name='analytics_v_url_id_592fc4_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:57
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_visit_url_dimension'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='visit',
+            options={},
+        ),
+    ]
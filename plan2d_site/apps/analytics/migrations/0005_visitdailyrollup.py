@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_remove_visit_ordering'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VisitDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(db_index=True)),
+                ('country_code', models.CharField(max_length=2)),
+                ('device_type', models.CharField(choices=[('mobile', 'Mobile'), ('desktop', 'Desktop')], max_length=10)),
+                ('visits', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('date', 'country_code', 'device_type')},
+            },
+        ),
+    ]
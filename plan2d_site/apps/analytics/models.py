@@ -1,12 +1,30 @@
+"""Privacy-respecting visit analytics.
+
+``Visit`` is an append-only table that grows with traffic. Code that walks
+its rows one by one (exports, admin actions, management commands) must use
+``.iterator(chunk_size=2000)`` rather than iterating a plain queryset, so
+rows are streamed (a server-side cursor on PostgreSQL) instead of loaded
+into memory all at once. Prefer grouped aggregations or ``VisitDailyRollup``
+whenever only counts are needed.
+"""
 from django.db import models
 
 
+class Url(models.Model):
+    """Distinct URL path; visits reference it instead of repeating the string."""
+
+    path = models.CharField(max_length=500, unique=True)
+
+    def __str__(self) -> str:
+        return self.path
+
+
 class Visit(models.Model):
     class DeviceType(models.TextChoices):
         MOBILE = "mobile", "Mobile"
         DESKTOP = "desktop", "Desktop"
 
-    url = models.CharField(max_length=500, db_index=True)
+    url = models.ForeignKey(Url, on_delete=models.PROTECT, related_name="visits")
     country_code = models.CharField(max_length=2, default="UN", db_index=True)
     device_type = models.CharField(
         max_length=10,
@@ -14,14 +32,36 @@ class Visit(models.Model):
         default=DeviceType.DESKTOP,
         db_index=True,
     )
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Indexed with a BRIN index on PostgreSQL (see migration 0002): the table is
+    # append-only, so a B-tree on created_at costs far more than it saves.
+    created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ["-created_at"]
+        # No default ordering: it would add ORDER BY to every aggregation.
+        # Order explicitly where needed (VisitAdmin.ordering).
         indexes = [
             models.Index(fields=["country_code", "created_at"]),
             models.Index(fields=["url", "created_at"]),
         ]
 
     def __str__(self) -> str:
-        return f"{self.country_code} {self.device_type} {self.url}"
+        return f"{self.country_code} {self.device_type} {self.url.path}"
+
+
+class VisitDailyRollup(models.Model):
+    """Per-day visit counts by country and device (see ``rollup_visits``).
+
+    Completed days never change, so the admin dashboard aggregates these rows
+    and only scans ``Visit`` for days that have not been rolled up yet.
+    """
+
+    date = models.DateField(db_index=True)
+    country_code = models.CharField(max_length=2)
+    device_type = models.CharField(max_length=10, choices=Visit.DeviceType.choices)
+    visits = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("date", "country_code", "device_type")
+
+    def __str__(self) -> str:
+        return f"{self.date} {self.country_code} {self.device_type}: {self.visits}"
@@ -0,0 +1,54 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+# Below this many rows an exact COUNT(*) is cheap and the planner estimate
+# (which can be stale or -1 before the first ANALYZE) is not worth trusting.
+ESTIMATE_THRESHOLD = 10_000
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that avoids ``COUNT(*)`` on large, unfiltered tables.
+
+    When the queryset carries no WHERE clause the row count is read from the
+    database statistics instead (``pg_class.reltuples`` on PostgreSQL,
+    ``information_schema.tables`` on MySQL). Filtered/searched querysets and
+    other backends fall back to the exact count.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        if estimate is not None and estimate >= ESTIMATE_THRESHOLD:
+            return estimate
+        return super().count
+
+    def _estimated_count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is None or query.where:
+            return None
+
+        db_table = self.object_list.model._meta.db_table
+        connection = connections[self.object_list.db]
+
+        if connection.vendor == "postgresql":
+            sql = "SELECT reltuples::bigint FROM pg_class WHERE relname = %s"
+        elif connection.vendor == "mysql":
+            sql = (
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s"
+            )
+        else:
+            return None
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, [db_table])
+                row = cursor.fetchone()
+        except Exception:
+            return None
+
+        if not row or row[0] is None:
+            return None
+        return int(row[0])
@@ -0,0 +1,72 @@
+"""Daily visit rollups backing the admin analytics dashboard."""
+from __future__ import annotations
+
+import datetime
+
+from django.db import transaction
+from django.db.models import Count, Max, Min
+from django.utils import timezone
+
+from .models import Visit, VisitDailyRollup
+
+
+def day_start(day: datetime.date) -> datetime.datetime:
+    """Aware datetime at midnight of ``day`` in the current time zone."""
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+def last_rolled_up_date() -> datetime.date | None:
+    return VisitDailyRollup.objects.aggregate(last=Max("date"))["last"]
+
+
+def next_pending_day() -> datetime.date | None:
+    """First day not covered by a rollup (the day after the last one, or the
+    first visit's day); ``None`` when there is nothing to roll up."""
+    last = last_rolled_up_date()
+    if last is not None:
+        return last + datetime.timedelta(days=1)
+    first_visit = Visit.objects.aggregate(first=Min("created_at"))["first"]
+    if first_visit is None:
+        return None
+    return timezone.localtime(first_visit).date()
+
+
+def pending_visits():
+    """Visits on days that are not covered by a rollup yet.
+
+    Rollups are contiguous (``rollup_visits`` refuses to leave a gap), so every
+    day up to the latest rollup is covered.
+    """
+    last = last_rolled_up_date()
+    if last is None:
+        return Visit.objects.all()
+    return Visit.objects.filter(created_at__gte=day_start(last + datetime.timedelta(days=1)))
+
+
+@transaction.atomic
+def rollup_day(day: datetime.date) -> int:
+    """(Re)build the rollup rows for ``day``; returns the number of visits counted.
+
+    Callers must keep rollups contiguous: only completed days up to
+    ``next_pending_day()`` may be rolled up.
+    """
+    rows = (
+        Visit.objects.filter(
+            created_at__gte=day_start(day),
+            created_at__lt=day_start(day + datetime.timedelta(days=1)),
+        )
+        .values("country_code", "device_type")
+        .annotate(visits=Count("id"))
+    )
+    rollups = [
+        VisitDailyRollup(
+            date=day,
+            country_code=row["country_code"],
+            device_type=row["device_type"],
+            visits=row["visits"],
+        )
+        for row in rows
+    ]
+    VisitDailyRollup.objects.filter(date=day).delete()
+    VisitDailyRollup.objects.bulk_create(rollups)
+    return sum(rollup.visits for rollup in rollups)
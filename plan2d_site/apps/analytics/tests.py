@@ -0,0 +1,93 @@
+import datetime
+import queue
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Sum
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from . import buffer
+from .models import Url, Visit, VisitDailyRollup
+from .rollups import day_start, pending_visits
+
+
+class RollupVisitsTests(TestCase):
+	"""Rolled-up and pending visits must always add up to every visit."""
+
+	def setUp(self):
+		self.url = Url.objects.create(path='/plans/')
+		self.today = timezone.localdate()
+		self.three_days_ago = self.today - datetime.timedelta(days=3)
+		self.two_days_ago = self.today - datetime.timedelta(days=2)
+		self._create_visits(self.three_days_ago, 2)
+		self._create_visits(self.two_days_ago, 3)
+		self._create_visits(self.today, 1)
+
+	def _create_visits(self, day, count):
+		for _ in range(count):
+			visit = Visit.objects.create(url=self.url)
+			Visit.objects.filter(pk=visit.pk).update(
+				created_at=day_start(day) + datetime.timedelta(hours=12)
+			)
+
+	def _dashboard_total(self):
+		rolled_up = VisitDailyRollup.objects.aggregate(total=Sum('visits'))['total'] or 0
+		return rolled_up + pending_visits().count()
+
+	def _rollup(self, *args):
+		call_command('rollup_visits', *args, stdout=StringIO())
+
+	def test_rollup_covers_every_completed_day(self):
+		self._rollup()
+		self.assertEqual(
+			set(VisitDailyRollup.objects.values_list('date', flat=True)),
+			{self.three_days_ago, self.two_days_ago},
+		)
+		self.assertEqual(pending_visits().count(), 1)
+		self.assertEqual(self._dashboard_total(), 6)
+
+	def test_date_option_refuses_to_leave_a_gap(self):
+		with self.assertRaises(CommandError):
+			self._rollup('--date', self.two_days_ago.isoformat())
+		self.assertFalse(VisitDailyRollup.objects.exists())
+		self.assertEqual(self._dashboard_total(), 6)
+
+	def test_date_option_refuses_today(self):
+		self._rollup()
+		with self.assertRaises(CommandError):
+			self._rollup('--date', self.today.isoformat())
+		self.assertEqual(self._dashboard_total(), 6)
+
+	def test_date_option_rebuilds_a_rolled_up_day(self):
+		self._rollup()
+		self._create_visits(self.three_days_ago, 1)
+		self._rollup('--date', self.three_days_ago.isoformat())
+		rebuilt = VisitDailyRollup.objects.filter(date=self.three_days_ago).aggregate(total=Sum('visits'))
+		self.assertEqual(rebuilt['total'], 3)
+		self.assertEqual(self._dashboard_total(), 7)
+
+
+class VisitBufferTests(TransactionTestCase):
+	"""The background writer keeps good visits when some rows cannot be saved."""
+
+	def setUp(self):
+		self.url = Url.objects.create(path='/plans/')
+
+	def test_flush_drops_only_visits_with_unknown_urls(self):
+		missing_url_id = self.url.pk + 1000
+		batch = [Visit(url_id=self.url.pk) for _ in range(3)] + [Visit(url_id=missing_url_id)]
+		buffer.flush(batch)
+		self.assertEqual(Visit.objects.filter(url=self.url).count(), 3)
+		self.assertFalse(Visit.objects.filter(url_id=missing_url_id).exists())
+
+	def test_stop_flushes_queued_visits(self):
+		# A private queue keeps a writer thread started by the middleware out of the way.
+		with mock.patch.object(buffer, '_VISIT_QUEUE', queue.SimpleQueue()):
+			for _ in range(3):
+				buffer.enqueue_visit(Visit(url_id=self.url.pk))
+			buffer._VISIT_QUEUE.put(buffer._STOP)
+			buffer._write_forever()
+		self.assertEqual(Visit.objects.count(), 3)
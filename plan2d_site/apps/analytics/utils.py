@@ -1,28 +1,36 @@
+import functools
 import hashlib
+import re
 from typing import Optional
 
 from django.conf import settings
 
+from .models import Url
 
-_MOBILE_UA_MARKERS = (
-    "mobi",
-    "android",
-    "iphone",
-    "ipad",
-    "ipod",
-    "windows phone",
-    "blackberry",
-    "opera mini",
+
+# Single case-insensitive pass over the User-Agent instead of one substring
+# scan per marker.
+_MOBILE_UA_RE = re.compile(
+    r"mobi|android|ip(?:hone|ad|od)|windows phone|blackberry|opera mini",
+    re.IGNORECASE,
 )
 
 
+# Crawlers and popular browsers repeat the same UA string constantly.
+@functools.lru_cache(maxsize=4096)
 def detect_device_type(user_agent: str) -> str:
-    ua = (user_agent or "").lower()
-    if any(marker in ua for marker in _MOBILE_UA_MARKERS):
+    if user_agent and _MOBILE_UA_RE.search(user_agent):
         return "mobile"
     return "desktop"
 
 
+# Paths repeat heavily, so only the first hit per path and process touches
+# the Url table.
+@functools.lru_cache(maxsize=10_000)
+def get_url_id(path: str) -> int:
+    return Url.objects.get_or_create(path=path)[0].pk
+
+
 def get_client_ip(request) -> Optional[str]:
     # Prefer proxy headers when present; fall back to REMOTE_ADDR.
     xff = request.META.get("HTTP_X_FORWARDED_FOR")
@@ -38,10 +46,42 @@ def get_client_ip(request) -> Optional[str]:
     return request.META.get("REMOTE_ADDR")
 
 
+# BLAKE2s accepts at most a 32-byte key; derive one from the full SECRET_KEY.
+_FINGERPRINT_KEY = hashlib.sha256(settings.SECRET_KEY.encode("utf-8")).digest()
+
+
 def hash_request_fingerprint(ip: Optional[str], user_agent: str) -> str:
     # Used only for throttling/deduping in cache. Never stored in DB.
-    raw = f"{settings.SECRET_KEY}|{ip or ''}|{user_agent or ''}".encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
+    # A keyed 128-bit BLAKE2s is plenty for a cache key and cheaper than SHA-256.
+    h = hashlib.blake2s(key=_FINGERPRINT_KEY, digest_size=16)
+    h.update((ip or "").encode("utf-8"))
+    h.update(b"|")
+    h.update((user_agent or "").encode("utf-8"))
+    return h.hexdigest()
+
+
+def _load_geoip():
+    # Open the MaxMind database once per process; the reader is thread-safe.
+    geoip_path = getattr(settings, "GEOIP_PATH", None)
+    if not geoip_path:
+        return None
+    try:
+        from django.contrib.gis.geoip2 import GeoIP2  # type: ignore
+
+        return GeoIP2(path=geoip_path)
+    except Exception:
+        return None
+
+
+_GEOIP = _load_geoip()
+
+
+@functools.lru_cache(maxsize=512)
+def _country_from_header_value(value: str) -> Optional[str]:
+    # Only the header branch is cached; GeoIP lookups depend on the client IP.
+    if len(value) == 2 and value.isalpha():
+        return value.upper()
+    return None
 
 
 def get_country_code_from_request(request) -> str:
@@ -53,21 +93,19 @@ def get_country_code_from_request(request) -> str:
         request.META.get("HTTP_X_COUNTRY"),
     )
     for value in header_candidates:
-        if value and len(value) == 2 and value.isalpha():
-            return value.upper()
+        if value:
+            code = _country_from_header_value(value)
+            if code:
+                return code
 
     # Optional GeoIP2 support (no hard dependency).
-    geoip_path = getattr(settings, "GEOIP_PATH", None)
-    if geoip_path:
-        try:
-            from django.contrib.gis.geoip2 import GeoIP2  # type: ignore
-
-            ip = get_client_ip(request)
-            if not ip:
-                return "UN"
+    if _GEOIP is not None:
+        ip = get_client_ip(request)
+        if not ip:
+            return "UN"
 
-            g = GeoIP2(path=geoip_path)
-            code = g.country_code(ip)
+        try:
+            code = _GEOIP.country_code(ip)
             if code and len(code) == 2:
                 return code.upper()
         except Exception:
@@ -6,7 +6,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.db import models
 from django.forms import Textarea
-from .models import Logo, PresentationSlider, LogoType
+from .models import Logo, PresentationSlider, LogoType, invalidate_slider_cache
 import logging
 
 logger = logging.getLogger('branding')
@@ -18,6 +18,7 @@ class LogoAdmin(admin.ModelAdmin):
     
     list_display = ['logo_type_display', 'preview', 'is_active', 'uploaded_at', 'uploaded_by']
     list_filter = ['logo_type', 'is_active', 'uploaded_at']
+    list_select_related = ['uploaded_by']
     readonly_fields = ['preview_large', 'uploaded_by', 'uploaded_at', 'updated_at']
     
     fieldsets = (
@@ -64,6 +65,10 @@ class LogoAdmin(admin.ModelAdmin):
         return "No image uploaded yet"
     preview_large.short_description = "Current Logo"
     
+    def get_queryset(self, request):
+        """Join the uploader so list and change views avoid per-row user lookups."""
+        return super().get_queryset(request).select_related('uploaded_by')
+    
     def save_model(self, request, obj, form, change):
         """Track who uploaded the logo."""
         if not change:  # New logo
@@ -92,6 +97,7 @@ class PresentationSliderAdmin(admin.ModelAdmin):
         'created_at'
     ]
     list_filter = ['is_active', 'is_deleted', 'created_at']
+    list_select_related = ['created_by']
     list_editable = ['display_order']
     search_fields = ['title', 'short_description']
     readonly_fields = ['preview_large', 'created_by', 'created_at', 'updated_at']
@@ -185,6 +191,7 @@ class PresentationSliderAdmin(admin.ModelAdmin):
     def activate_slides(self, request, queryset):
         """Activate selected slides."""
         count = queryset.update(is_active=True)
+        invalidate_slider_cache()
         self.message_user(request, f"Activated {count} slide(s)")
         logger.info(f"Bulk activated {count} slides by {request.user.username}")
     activate_slides.short_description = "✓ Activate selected slides"
@@ -192,6 +199,7 @@ class PresentationSliderAdmin(admin.ModelAdmin):
     def deactivate_slides(self, request, queryset):
         """Deactivate selected slides."""
         count = queryset.update(is_active=False)
+        invalidate_slider_cache()
         self.message_user(request, f"Deactivated {count} slide(s)")
         logger.info(f"Bulk deactivated {count} slides by {request.user.username}")
     deactivate_slides.short_description = "⊘ Deactivate selected slides"
@@ -199,6 +207,7 @@ class PresentationSliderAdmin(admin.ModelAdmin):
     def soft_delete_slides(self, request, queryset):
         """Soft delete selected slides."""
         count = queryset.update(is_deleted=True, is_active=False)
+        invalidate_slider_cache()
         self.message_user(request, f"Soft deleted {count} slide(s)")
         logger.warning(f"Bulk soft deleted {count} slides by {request.user.username}")
     soft_delete_slides.short_description = "🗑️ Soft delete selected slides"
@@ -206,6 +215,7 @@ class PresentationSliderAdmin(admin.ModelAdmin):
     def restore_slides(self, request, queryset):
         """Restore soft-deleted slides."""
         count = queryset.filter(is_deleted=True).update(is_deleted=False)
+        invalidate_slider_cache()
         self.message_user(request, f"Restored {count} slide(s)")
         logger.info(f"Bulk restored {count} slides by {request.user.username}")
     restore_slides.short_description = "♻️ Restore deleted slides"
@@ -1,10 +1,14 @@
 """
 Context processor to make branding assets available in all templates.
 Provides logos and slider images without hardcoding paths.
+
+Results are memoized on the request, so rendering several templates for one
+request (includes, error pages, emails) hits the cache/DB at most once.
 """
+from django.core.cache import cache
 from django.db.utils import ProgrammingError
 
-from .models import Logo, LogoType, PresentationSlider
+from .models import BRANDING_CACHE_TIMEOUT, SLIDER_CACHE_KEY, Logo, LogoType, PresentationSlider
 
 
 def branding_context(request):
@@ -12,11 +16,34 @@ def branding_context(request):
     Add branding assets to template context.
     Makes logos and slider images available globally.
     """
+    context = getattr(request, '_branding_ctx', None)
+    if context is None:
+        context = _load_branding()
+        if request is not None:
+            request._branding_ctx = context
+    return context
+
+
+def slider_context(request):
+    """
+    Add visible slider images to template context.
+    Only includes active, non-deleted slides in display order.
+    """
+    context = getattr(request, '_slider_ctx', None)
+    if context is None:
+        context = _load_slider()
+        if request is not None:
+            request._slider_ctx = context
+    return context
+
+
+def _load_branding():
     try:
+        logos = Logo.get_active_logos()
         return {
-            'site_logo': Logo.get_active_logo(LogoType.MAIN),
-            'footer_logo': Logo.get_active_logo(LogoType.FOOTER),
-            'favicon': Logo.get_active_logo(LogoType.FAVICON),
+            'site_logo': logos.get(LogoType.MAIN),
+            'footer_logo': logos.get(LogoType.FOOTER),
+            'favicon': logos.get(LogoType.FAVICON),
         }
     except ProgrammingError:
         # Fail-safe: if branding tables are not migrated yet, render without assets.
@@ -27,15 +54,17 @@ def branding_context(request):
         }
 
 
-def slider_context(request):
-    """
-    Add visible slider images to template context.
-    Only includes active, non-deleted slides in display order.
-    """
+def _load_slider():
+    slides = cache.get(SLIDER_CACHE_KEY)
+    if slides is not None:
+        return {'slider_images': slides}
+
     try:
         # Limit to 10 slides
+        slides = list(PresentationSlider.objects.visible()[:10])
+        cache.set(SLIDER_CACHE_KEY, slides, timeout=BRANDING_CACHE_TIMEOUT)
         return {
-            'slider_images': list(PresentationSlider.objects.visible()[:10])
+            'slider_images': slides
         }
     except ProgrammingError:
         return {
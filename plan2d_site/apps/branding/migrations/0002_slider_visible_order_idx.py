@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('branding', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='presentationslider',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_deleted', False)), fields=['display_order'], name='slider_visible_order_idx'),
+        ),
+    ]
@@ -3,6 +3,7 @@ Branding & Presentation models for managing site visuals.
 Allows admin to control logos and presentation slider images.
 """
 from django.db import models
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
 from django.utils.text import slugify
@@ -12,6 +13,43 @@ from PIL import Image
 
 User = get_user_model()
 
+# Branding assets change rarely but are read on every page render. The default
+# cache is per-process LocMem (no CACHES setting), so the invalidation below
+# only reaches the worker that handled the admin save; other gunicorn workers
+# keep their copy until it expires. Keep the TTL short enough for that stale
+# window to be acceptable; switch to a shared backend before raising it.
+BRANDING_CACHE_TIMEOUT = 60
+ACTIVE_LOGOS_CACHE_KEY = 'branding:logos:active'
+SLIDER_CACHE_KEY = 'branding:slider:top10'
+
+
+def invalidate_logo_cache():
+    """Drop the cached active logos."""
+    cache.delete(ACTIVE_LOGOS_CACHE_KEY)
+
+
+def invalidate_slider_cache():
+    """Drop the cached frontend slides (call after bulk updates)."""
+    cache.delete(SLIDER_CACHE_KEY)
+
+
+def _read_image_size(image_file):
+    """
+    Return (width, height) from the image header.
+    Image.open() only parses the header, so unlike verify() this does not read
+    and decode the whole upload. The file is rewound for the subsequent save.
+    """
+    try:
+        with Image.open(image_file) as img:
+            return img.size
+    except Exception as e:
+        raise ValidationError(f"Invalid image file: {str(e)}")
+    finally:
+        try:
+            image_file.seek(0)
+        except Exception:
+            pass
+
 
 class SliderManager(models.Manager):
     """Custom manager for presentation slides."""
@@ -96,17 +134,12 @@ class Logo(models.Model):
             if self.image.size > 5 * 1024 * 1024:
                 raise ValidationError("Logo file size must be less than 5MB")
 
-            # Validate image can be opened
-            try:
-                img = Image.open(self.image)
-                img.verify()
-                
-                # Check dimensions for favicon
-                if self.logo_type == LogoType.FAVICON:
-                    if img.size[0] > 512 or img.size[1] > 512:
-                        raise ValidationError("Favicon dimensions should not exceed 512x512 pixels")
-            except Exception as e:
-                raise ValidationError(f"Invalid image file: {str(e)}")
+            width, height = _read_image_size(self.image)
+
+            # Check dimensions for favicon
+            if self.logo_type == LogoType.FAVICON:
+                if width > 512 or height > 512:
+                    raise ValidationError("Favicon dimensions should not exceed 512x512 pixels")
 
     def save(self, *args, **kwargs):
         # If setting as active, deactivate other logos of same type
@@ -114,14 +147,29 @@ class Logo(models.Model):
             Logo.objects.filter(logo_type=self.logo_type).exclude(pk=self.pk).update(is_active=False)
         
         super().save(*args, **kwargs)
+        invalidate_logo_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        invalidate_logo_cache()
+        return result
+
+    @classmethod
+    def get_active_logos(cls):
+        """Get all active logos keyed by logo type, in a single query (cached)."""
+        logos = cache.get(ACTIVE_LOGOS_CACHE_KEY)
+        if logos is None:
+            logos = {
+                logo.logo_type: logo
+                for logo in cls.objects.filter(logo_type__in=LogoType.values, is_active=True)
+            }
+            cache.set(ACTIVE_LOGOS_CACHE_KEY, logos, timeout=BRANDING_CACHE_TIMEOUT)
+        return logos
 
     @classmethod
     def get_active_logo(cls, logo_type):
         """Get the active logo for a specific type."""
-        try:
-            return cls.objects.get(logo_type=logo_type, is_active=True)
-        except cls.DoesNotExist:
-            return None
+        return cls.get_active_logos().get(logo_type)
 
 
 class PresentationSlider(models.Model):
@@ -179,6 +227,15 @@ class PresentationSlider(models.Model):
         verbose_name = "Presentation Slide"
         verbose_name_plural = "Presentation Slider"
         ordering = ['display_order', '-created_at']
+        indexes = [
+            # Partial index matching SliderManager.visible(): filter + ORDER BY
+            # display_order are answered by the index alone.
+            models.Index(
+                fields=['display_order'],
+                condition=models.Q(is_active=True, is_deleted=False),
+                name='slider_visible_order_idx',
+            ),
+        ]
 
     def __str__(self):
         status = "Active" if self.is_active else "Inactive"
@@ -191,16 +248,20 @@ class PresentationSlider(models.Model):
             if self.image.size > 10 * 1024 * 1024:
                 raise ValidationError("Image file size must be less than 10MB")
 
-            # Validate image dimensions
-            try:
-                img = Image.open(self.image)
-                img.verify()
-                
-                # Recommend minimum dimensions for quality
-                if img.size[0] < 800:
-                    raise ValidationError("Image width should be at least 800px for quality display")
-            except Exception as e:
-                raise ValidationError(f"Invalid image file: {str(e)}")
+            width, _height = _read_image_size(self.image)
+
+            # Recommend minimum dimensions for quality
+            if width < 800:
+                raise ValidationError("Image width should be at least 800px for quality display")
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_slider_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        invalidate_slider_cache()
+        return result
 
     @property
     def is_visible(self):
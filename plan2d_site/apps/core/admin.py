@@ -52,6 +52,9 @@ class ContactMessageAdmin(admin.ModelAdmin):
     list_per_page = 25
     date_hierarchy = 'created_at'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_attachment_flag()
+    
     def subject_display(self, obj):
         """Display subject with icon."""
         icons = {
@@ -67,7 +70,10 @@ class ContactMessageAdmin(admin.ModelAdmin):
     
     def has_file(self, obj):
         """Show if message has attachment."""
-        if obj.has_attachment:
+        has_attachment = getattr(obj, 'attachment_flag', None)
+        if has_attachment is None:  # not loaded through get_queryset
+            has_attachment = obj.has_attachment
+        if has_attachment:
             return format_html(
                 '<span style="color: green;">{}</span>',
                 '✓ Yes'
@@ -77,6 +83,7 @@ class ContactMessageAdmin(admin.ModelAdmin):
             '✗ No'
         )
     has_file.short_description = 'File'
+    has_file.admin_order_field = 'attachment_flag'
     
     def attachment_preview(self, obj):
         """Show attachment with download link."""
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from django.conf import settings
+from functools import lru_cache
 
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
-def brand(request):
-    site_base_url = getattr(settings, "SITE_BASE_URL", "").rstrip("/")
 
+@lru_cache(maxsize=1)
+def _brand_context() -> dict:
+    # Settings are fixed after startup, so the dict is built once per process.
     return {
         "brand_name": getattr(settings, "BRAND_NAME", "FreeHousePlan"),
         "brand_domain": getattr(settings, "BRAND_DOMAIN", "FreeHousePlan.com"),
@@ -14,6 +18,16 @@ def brand(request):
             "BRAND_TAGLINE",
             "Free house plans. Upgrade when you're ready to build.",
         ),
-        "site_base_url": site_base_url,
+        "site_base_url": getattr(settings, "SITE_BASE_URL", "").rstrip("/"),
         "support_email": getattr(settings, "SUPPORT_EMAIL", "support@freehouseplan.com"),
     }
+
+
+@receiver(setting_changed)
+def _reset_brand_context(**kwargs) -> None:
+    # Keeps override_settings() in tests effective.
+    _brand_context.cache_clear()
+
+
+def brand(request):
+    return _brand_context()
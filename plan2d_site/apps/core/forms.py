@@ -4,7 +4,13 @@ Forms for the core app.
 from django import forms
 from django.conf import settings
 from .models import ContactMessage
-import os
+
+# Upload limits are fixed at startup; resolve them once instead of per upload.
+_MAX_ATTACHMENT_SIZE = settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+_ALLOWED_EXTENSIONS = frozenset(
+    ext.lower().lstrip('.') for ext in settings.CONTACT_ALLOWED_FILE_TYPES
+)
+_ALLOWED_EXTENSIONS_DISPLAY = ", ".join(settings.CONTACT_ALLOWED_FILE_TYPES)
 
 
 class ContactMessageForm(forms.ModelForm):
@@ -60,18 +66,18 @@ class ContactMessageForm(forms.ModelForm):
         
         if attachment:
             # Check file size (10MB max)
-            if attachment.size > settings.FILE_UPLOAD_MAX_MEMORY_SIZE:
+            if attachment.size > _MAX_ATTACHMENT_SIZE:
                 raise forms.ValidationError(
                     f'File size must be under 10MB. Your file is {attachment.size / (1024*1024):.1f}MB.'
                 )
             
             # Check file extension
-            file_ext = os.path.splitext(attachment.name)[1][1:].lower()
-            allowed_types = settings.CONTACT_ALLOWED_FILE_TYPES
+            _, dot, file_ext = attachment.name.rpartition('.')
+            file_ext = file_ext.lower() if dot else ''
             
-            if file_ext not in allowed_types:
+            if file_ext not in _ALLOWED_EXTENSIONS:
                 raise forms.ValidationError(
-                    f'File type .{file_ext} is not allowed. Allowed types: {", ".join(allowed_types)}'
+                    f'File type .{file_ext} is not allowed. Allowed types: {_ALLOWED_EXTENSIONS_DISPLAY}'
                 )
         
         return attachment
@@ -80,7 +86,8 @@ class ContactMessageForm(forms.ModelForm):
         """
         Ensure message has minimum length.
         """
+        # The model-derived CharField already strips surrounding whitespace.
         message = self.cleaned_data.get('message', '')
-        if len(message.strip()) < 10:
+        if len(message) < 10:
             raise forms.ValidationError('Please provide a more detailed message (at least 10 characters).')
         return message
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['is_read', '-created_at'], name='contact_read_created_idx'),
+        ),
+    ]
@@ -1,6 +1,10 @@
 from django.db import models
 from django.utils import timezone
 import os
+import re
+
+# Anything other than letters, digits, spaces, hyphens and underscores.
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]')
 
 
 def contact_upload_path(instance, filename):
@@ -9,12 +13,29 @@ def contact_upload_path(instance, filename):
     """
     # Sanitize filename
     name, ext = os.path.splitext(filename)
-    safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
+    safe_name = _UNSAFE_FILENAME_CHARS.sub('', name).strip()
     safe_name = safe_name[:50]  # Limit length
     timestamp = timezone.now().strftime('%Y%m%d_%H%M%S')
     return f'contact_uploads/{timestamp}_{safe_name}{ext}'
 
 
+class ContactMessageQuerySet(models.QuerySet):
+    """Database-side filters for contact messages."""
+
+    def unread(self):
+        return self.filter(is_read=False)
+
+    def with_attachment_flag(self):
+        """Annotate ``attachment_flag`` so lists don't evaluate has_attachment per row."""
+        return self.annotate(
+            attachment_flag=models.Case(
+                models.When(models.Q(attachment__isnull=True) | models.Q(attachment=''), then=models.Value(False)),
+                default=models.Value(True),
+                output_field=models.BooleanField(),
+            )
+        )
+
+
 class ContactMessage(models.Model):
     """
     Store contact form submissions with optional file attachments.
@@ -45,10 +66,15 @@ class ContactMessage(models.Model):
     is_read = models.BooleanField(default=False)
     admin_notes = models.TextField(blank=True)
     
+    objects = ContactMessageQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Contact Message'
         verbose_name_plural = 'Contact Messages'
+        indexes = [
+            models.Index(fields=['is_read', '-created_at'], name='contact_read_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.full_name} - {self.get_subject_display()} ({self.created_at.strftime('%Y-%m-%d')})"
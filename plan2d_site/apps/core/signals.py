@@ -0,0 +1,19 @@
+"""
+Signal handlers for the core app.
+Keeps the cached homepage showcase in sync with the plan catalog.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.plans.models import Plan
+
+HOME_SHOWCASE_CACHE_KEY = 'home:featured:v1'
+HOME_SHOWCASE_CACHE_TIMEOUT = 300
+
+
+@receiver(post_save, sender=Plan)
+@receiver(post_delete, sender=Plan)
+def invalidate_home_showcase(sender, **kwargs):
+    """Drop the cached homepage showcase whenever a plan changes."""
+    cache.delete(HOME_SHOWCASE_CACHE_KEY)
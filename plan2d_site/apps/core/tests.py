@@ -1,3 +1,45 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
 
-# Create your tests here
+from .views import CONTACT_RATE_WINDOW
+
+
+@override_settings(CONTACT_RATE_LIMIT=2, TRUSTED_PROXY_COUNT=1)
+class ContactAbuseGuardTests(TestCase):
+	"""Oversize and too-frequent contact submissions are refused up front."""
+
+	def setUp(self):
+		cache.clear()
+		self.url = reverse('core:contact')
+
+	def _post(self, forwarded_for):
+		return self.client.post(self.url, {}, HTTP_X_FORWARDED_FOR=forwarded_for)
+
+	def test_rate_limit_returns_429_with_retry_after(self):
+		for _ in range(2):
+			self.assertEqual(self._post('203.0.113.5').status_code, 200)
+		response = self._post('203.0.113.5')
+		self.assertEqual(response.status_code, 429)
+		self.assertEqual(response['Retry-After'], str(CONTACT_RATE_WINDOW))
+
+	def test_forged_forwarded_for_entries_do_not_reset_the_limit(self):
+		for i in range(2):
+			self._post(f'198.51.100.{i}, 203.0.113.5')
+		response = self._post('198.51.100.99, 203.0.113.5')
+		self.assertEqual(response.status_code, 429)
+
+	def test_clients_are_limited_separately(self):
+		for _ in range(3):
+			self._post('203.0.113.5')
+		self.assertEqual(self._post('203.0.113.6').status_code, 200)
+
+	@override_settings(TRUSTED_PROXY_COUNT=0)
+	def test_without_trusted_proxies_the_header_is_ignored(self):
+		for i in range(2):
+			self._post(f'198.51.100.{i}')
+		self.assertEqual(self._post('198.51.100.99').status_code, 429)
+
+	def test_oversize_request_returns_413(self):
+		response = self.client.post(self.url, {}, CONTENT_LENGTH=str(10 ** 9))
+		self.assertEqual(response.status_code, 413)
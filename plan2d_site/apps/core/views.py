@@ -3,12 +3,18 @@ from django.views.generic import TemplateView
 from django.contrib import messages
 from django.http import HttpResponse
 from django.views import View
+from django.views.decorators.cache import cache_control
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+from django.utils.decorators import method_decorator
 from django.conf import settings
-from django.db.models import Min
+from django.core.cache import cache
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
 from django.db.utils import ProgrammingError
 from .forms import ContactMessageForm
-from apps.notifications.services import notify_admin_new_contact
+from .signals import HOME_SHOWCASE_CACHE_KEY, HOME_SHOWCASE_CACHE_TIMEOUT
+from apps.notifications.tasks import notify_admin_new_contact_task
 from apps.plans.models import Plan
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger('core')
@@ -23,45 +29,16 @@ class HomeView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         try:
-            visible_plans = (
-                Plan.objects.visible()
-                .select_related('category')
-                .prefetch_related('images')
-                .order_by('-featured', '-created_at')
-            )
-
-            featured = list(visible_plans.filter(featured=True)[:6])
-
-            if len(featured) < 6:
-                needed = 6 - len(featured)
-                fallback = list(
-                    visible_plans.exclude(pk__in=[plan.pk for plan in featured])[:needed]
-                )
-                featured.extend(fallback)
-
-                if fallback:
-                    logger.info(
-                        "HomeView: supplementing featured plans with %s fallback plan(s) to keep the showcase visible",
-                        len(fallback)
-                    )
+            showcase = cache.get(HOME_SHOWCASE_CACHE_KEY)
+            if showcase is None:
+                featured, showcase = self._build_showcase()
+                cache.set(HOME_SHOWCASE_CACHE_KEY, showcase, HOME_SHOWCASE_CACHE_TIMEOUT)
+            else:
+                featured = self._load_featured(showcase['featured_plan_pks'])
 
             context['featured_plans'] = featured
-
-            pack2_min_price = (
-                visible_plans.filter(price__gt=0)
-                .exclude(pack_2_gumroad_zip_url='')
-                .aggregate(value=Min('price'))
-                .get('value')
-            )
-            pack3_min_price = (
-                visible_plans.filter(pack_3_price__gt=0)
-                .exclude(pack_3_gumroad_zip_url='')
-                .aggregate(value=Min('pack_3_price'))
-                .get('value')
-            )
-
-            context['pack2_min_price'] = pack2_min_price
-            context['pack3_min_price'] = pack3_min_price
+            context['pack2_min_price'] = showcase['pack2_min_price']
+            context['pack3_min_price'] = showcase['pack3_min_price']
         except ProgrammingError:
             # Fail-safe: homepage must render even if DB tables are not created yet.
             context['featured_plans'] = []
@@ -70,6 +47,29 @@ class HomeView(TemplateView):
             logger.warning("HomeView: database tables missing; rendering empty homepage showcase")
         return context
 
+    def _load_featured(self, pks):
+        """Re-hydrate cached showcase plan PKs, preserving their ranking."""
+        plans = Plan.objects.showcase_cards().in_bulk(pks)
+        return [plans[pk] for pk in pks if pk in plans]
+
+    def _build_showcase(self):
+        """Query featured plans and pack prices; returns (plans, cacheable dict)."""
+        showcase = Plan.objects.homepage_showcase()
+        featured = showcase.plans
+
+        fallback_count = sum(1 for plan in featured if not plan.featured)
+        if fallback_count:
+            logger.info(
+                "HomeView: supplementing featured plans with %s fallback plan(s) to keep the showcase visible",
+                fallback_count
+            )
+
+        return featured, {
+            'featured_plan_pks': [plan.pk for plan in featured],
+            'pack2_min_price': showcase.pack2_min_price,
+            'pack3_min_price': showcase.pack3_min_price,
+        }
+
 
 class AboutView(TemplateView):
     """
@@ -85,12 +85,67 @@ class FAQView(TemplateView):
     template_name = 'core/faq.html'
 
 
+# Contact submissions allowed per client IP per window (CONTACT_RATE_LIMIT).
+CONTACT_RATE_WINDOW = 3600
+
+
 class ContactView(TemplateView):
     """
     Contact page with form for user inquiries with file upload support.
     """
     template_name = 'core/contact.html'
 
+    @method_decorator(csrf_exempt)
+    def dispatch(self, request, *args, **kwargs):
+        if request.method == 'POST':
+            rejection = self._reject_early(request)
+            if rejection is not None:
+                return rejection
+
+        # Stream attachments to a temporary file instead of buffering up to
+        # 10MB in memory. Upload handlers must be swapped before anything reads
+        # request.POST, which CsrfViewMiddleware would do, so CSRF is enforced
+        # just below instead.
+        request.upload_handlers = [TemporaryFileUploadHandler(request)]
+        return self._csrf_protected_dispatch(request, *args, **kwargs)
+
+    @method_decorator(csrf_protect)
+    def _csrf_protected_dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+
+    def _reject_early(self, request):
+        """
+        Refuse oversize or too-frequent submissions from headers alone,
+        before the multipart body is read. Returns a response or None.
+        """
+        try:
+            content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > settings.CONTACT_MAX_REQUEST_SIZE:
+            logger.warning(f"Rejected oversize contact submission ({content_length} bytes)")
+            return HttpResponse('Request too large.', status=413, content_type='text/plain')
+
+        limit = settings.CONTACT_RATE_LIMIT
+        if limit:
+            client_ip = self.get_trusted_client_ip(request)
+            key = f'contact:rate:{client_ip}'
+            cache.add(key, 0, CONTACT_RATE_WINDOW)
+            try:
+                count = cache.incr(key)
+            except ValueError:
+                # Window expired between add() and incr().
+                cache.set(key, 1, CONTACT_RATE_WINDOW)
+                count = 1
+            if count > limit:
+                logger.warning(f"Rate-limited contact submissions from {client_ip}")
+                response = HttpResponse(
+                    'Too many messages. Please try again later.', status=429, content_type='text/plain'
+                )
+                response['Retry-After'] = str(CONTACT_RATE_WINDOW)
+                return response
+        return None
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = ContactMessageForm()
@@ -112,24 +167,16 @@ class ContactView(TemplateView):
             contact_msg.user_agent = request.META.get('HTTP_USER_AGENT', '')[:500]
             contact_msg.save()
             
-            # Send email notification to admin using centralized service
-            notification_sent = notify_admin_new_contact(contact_msg)
-            
-            if notification_sent:
-                logger.info(f"Admin notified of new contact message from {contact_msg.email}")
-                messages.success(
-                    request,
-                    f'Thank you, {contact_msg.full_name}! Your message has been sent successfully. '
-                    f'We will get back to you at {contact_msg.email} within 24-48 hours.'
-                )
-            else:
-                # Message saved even if email notification failed
-                logger.warning(f"Admin notification failed for contact from {contact_msg.email}")
-                messages.warning(
-                    request,
-                    f'Your message has been saved, but there was an issue sending the notification. '
-                    f'You can also reach us on WhatsApp: {settings.ADMIN_WHATSAPP}'
-                )
+            # Notify admin in the background; the message is already saved,
+            # so SMTP problems never affect the visitor.
+            notify_admin_new_contact_task.delay(contact_msg.pk)
+            logger.info(f"Queued admin notification for contact message from {contact_msg.email}")
+
+            messages.success(
+                request,
+                f'Thank you, {contact_msg.full_name}! Your message has been sent successfully. '
+                f'We will get back to you at {contact_msg.email} within 24-48 hours.'
+            )
             
             return redirect('core:contact')
         else:
@@ -150,18 +197,39 @@ class ContactView(TemplateView):
             ip = request.META.get('REMOTE_ADDR')
         return ip
 
+    def get_trusted_client_ip(self, request):
+        """
+        Client address as recorded by our own proxies (TRUSTED_PROXY_COUNT),
+        ignoring X-Forwarded-For entries the client could have forged.
+        """
+        hops = settings.TRUSTED_PROXY_COUNT
+        if hops:
+            forwarded = [ip.strip() for ip in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')]
+            if len(forwarded) >= hops and forwarded[-hops]:
+                return forwarded[-hops]
+        return request.META.get('REMOTE_ADDR')
+
+
+_ROBOTS_BODY_TEMPLATE = (
+    "User-agent: *\n"
+    "Allow: /\n"
+    "Disallow: /admin/\n"
+    "Disallow: /media/paid-plans/\n"  # Protect paid plan files
+    "\n"
+    "Sitemap: {scheme}://{host}/sitemap.xml"
+)
+
+
+@lru_cache(maxsize=32)
+def _robots_body(scheme, host):
+    return _ROBOTS_BODY_TEMPLATE.format(scheme=scheme, host=host)
+
 
+@method_decorator(cache_control(public=True, max_age=86400), name='dispatch')
 class RobotsView(View):
     """
     Robots.txt file for SEO and crawler control.
     """
     def get(self, request):
-        lines = [
-            "User-agent: *",
-            "Allow: /",
-            "Disallow: /admin/",
-            "Disallow: /media/paid-plans/",  # Protect paid plan files
-            "",
-            f"Sitemap: {request.build_absolute_uri('/sitemap.xml')}",
-        ]
-        return HttpResponse("\n".join(lines), content_type="text/plain")
+        body = _robots_body(request.scheme, request.get_host())
+        return HttpResponse(body, content_type="text/plain")
@@ -3,14 +3,139 @@
 All admin notifications go through this module for consistent logging and error handling.
 """
 import logging
+import mimetypes
+import os
 from django.core.mail import EmailMessage
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from .models import EmailLog
 
 # Configure logger
 logger = logging.getLogger('notifications')
 
+# Resolved once at import; these never change for the life of a process.
+_BRAND_DOMAIN = getattr(settings, 'BRAND_DOMAIN', 'FreeHousePlan.com')
+_SITE_URL = getattr(settings, 'SITE_URL', 'http://localhost:8000')
+_ADMIN_EMAIL = getattr(settings, 'ADMIN_EMAIL', 'entreprise2rc@gmail.com')
+_FROM_EMAIL = getattr(settings, 'DEFAULT_FROM_EMAIL', 'FreeHousePlan.com <noreply@freehouseplan.com>')
+
+# Backends that never deliver mail; logging their sends to EmailLog only
+# fills the dev/test database.
+_NON_DELIVERING_BACKENDS = (
+    '.console.EmailBackend',
+    '.locmem.EmailBackend',
+    '.dummy.EmailBackend',
+)
+
+# Plain-text admin notification bodies, rendered with str.format_map().
+_CONTACT_BODY = """
+════════════════════════════════════════════════════════════
+📬 NEW CONTACT MESSAGE RECEIVED
+════════════════════════════════════════════════════════════
+
+From: {name}
+Email: {email}
+Subject: {subject}
+Date: {date}
+IP Address: {ip}
+
+────────────────────────────────────────────────────────────
+MESSAGE:
+────────────────────────────────────────────────────────────
+
+{message}
+
+────────────────────────────────────────────────────────────
+ATTACHMENT: {attachment}
+────────────────────────────────────────────────────────────
+
+Reply directly to: {email}
+
+---
+This notification was sent by the {brand_domain} Contact System.
+Manage messages: {site_url}/admin/core/contactmessage/
+"""
+
+_RECEIPT_ATTACHED = """
+────────────────────────────────────────────────────────────
+PAYMENT RECEIPT: ✓ ATTACHED
+────────────────────────────────────────────────────────────
+Receipt file is attached to this email for verification.
+"""
+
+_RECEIPT_MISSING = """
+────────────────────────────────────────────────────────────
+PAYMENT RECEIPT: ✗ NOT UPLOADED
+────────────────────────────────────────────────────────────
+Customer has not uploaded a receipt yet.
+"""
+
+_ORDER_BODY = """
+════════════════════════════════════════════════════════════
+💰 NEW ORDER RECEIVED - ACTION REQUIRED
+════════════════════════════════════════════════════════════
+
+Order Number: {order_number}
+Status: {status}
+Created: {created}
+
+────────────────────────────────────────────────────────────
+CUSTOMER INFORMATION:
+────────────────────────────────────────────────────────────
+
+Name: {buyer_name}
+Email: {buyer_email}
+
+────────────────────────────────────────────────────────────
+ORDER DETAILS:
+────────────────────────────────────────────────────────────
+
+Plan: {plan_title}
+Reference: {plan_reference}
+Price: ${price} {currency}
+Payment Method: {payment_method}
+Payment Provider: {payment_provider}
+{receipt_info}
+────────────────────────────────────────────────────────────
+REQUIRED ACTION:
+────────────────────────────────────────────────────────────
+
+1. Review the payment receipt
+2. Verify payment was received to your account
+3. Approve or reject the order in the admin panel
+
+Admin Panel: {site_url}/admin/orders/order/{order_pk}/change/
+
+---
+This notification was sent by the {brand_domain} Order System.
+"""
+
+_RECEIPT_BODY = """
+════════════════════════════════════════════════════════════
+📎 PAYMENT RECEIPT UPLOADED - VERIFICATION NEEDED
+════════════════════════════════════════════════════════════
+
+Order Number: {order_number}
+Customer: {buyer_name} ({buyer_email})
+
+Plan: {plan_title}
+Price: ${price} {currency}
+Payment Method: {payment_method}
+
+────────────────────────────────────────────────────────────
+RECEIPT ATTACHED
+────────────────────────────────────────────────────────────
+
+Please review the attached receipt and verify payment.
+
+Action required: Approve or reject in admin panel
+Admin Panel: {site_url}/admin/orders/order/{order_pk}/change/
+
+---
+This notification was sent by the {brand_domain} Order System.
+"""
+
 
 class NotificationService:
     """
@@ -21,18 +146,26 @@ class NotificationService:
     @classmethod
     def get_admin_email(cls):
         """Get admin email from settings."""
-        return getattr(settings, 'ADMIN_EMAIL', 'entreprise2rc@gmail.com')
+        return _ADMIN_EMAIL
     
     @classmethod
     def get_from_email(cls):
         """Get default from email."""
-        return getattr(settings, 'DEFAULT_FROM_EMAIL', 'FreeHousePlan.com <noreply@freehouseplan.com>')
+        return _FROM_EMAIL
+    
+    @classmethod
+    def should_persist_log(cls):
+        """Whether sends are recorded in EmailLog (NOTIFICATIONS_PERSIST_LOG overrides)."""
+        persist = getattr(settings, 'NOTIFICATIONS_PERSIST_LOG', None)
+        if persist is None:
+            return not settings.EMAIL_BACKEND.endswith(_NON_DELIVERING_BACKENDS)
+        return persist
     
     @classmethod
     def send_email(cls, to_email, subject, body, category='other', 
                    attachment_path=None, attachment_name=None,
                    reply_to=None, related_contact_id=None, related_order_id=None,
-                   fail_silently=False):
+                   fail_silently=False, connection=None):
         """
         Send an email with full logging and error tracking.
         
@@ -47,23 +180,30 @@ class NotificationService:
             related_contact_id: ID of related ContactMessage (optional)
             related_order_id: ID of related Order (optional)
             fail_silently: If True, don't raise exceptions on failure
+            connection: Open mail backend to reuse across several sends (optional)
             
         Returns:
             bool: True if email was sent successfully, False otherwise
         """
-        # Create log entry
-        log_entry = EmailLog.objects.create(
+        log_fields = dict(
             to_email=to_email,
             from_email=cls.get_from_email(),
             subject=subject,
             category=category,
-            status='pending',
             has_attachment=bool(attachment_path),
             attachment_name=attachment_name or '',
             related_contact_id=related_contact_id,
             related_order_id=related_order_id,
         )
         
+        # Plain emails are logged with a single INSERT once the outcome is
+        # known. Sends with attachments are slow enough that a crashed worker
+        # could lose the record, so they keep a pending row updated afterwards.
+        persist_log = cls.should_persist_log()
+        log_entry = None
+        if persist_log and attachment_path:
+            log_entry = EmailLog.objects.create(status='pending', **log_fields)
+        
         try:
             # Build email
             email = EmailMessage(
@@ -72,12 +212,16 @@ class NotificationService:
                 from_email=cls.get_from_email(),
                 to=[to_email],
                 reply_to=[reply_to] if reply_to else None,
+                connection=connection,
             )
             
             # Add attachment if provided
             if attachment_path:
                 try:
-                    email.attach_file(attachment_path)
+                    filename = attachment_name or os.path.basename(attachment_path)
+                    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                    with open(attachment_path, 'rb') as fh:
+                        email.attach(filename, fh.read(), mimetype)
                     logger.info(f"Attached file: {attachment_path}")
                 except Exception as attach_error:
                     logger.warning(f"Could not attach file {attachment_path}: {attach_error}")
@@ -86,22 +230,36 @@ class NotificationService:
             # Send email
             email.send(fail_silently=False)
             
-            # Mark as sent
-            log_entry.mark_sent()
-            logger.info(f"Email sent successfully: [{category}] {subject} -> {to_email}")
-            
-            return True
-            
         except Exception as e:
             # Log failure
             error_msg = str(e)
-            log_entry.mark_failed(error_msg)
+            if log_entry:
+                transaction.on_commit(lambda: log_entry.mark_failed(error_msg), robust=True)
+            elif persist_log:
+                transaction.on_commit(
+                    lambda: EmailLog.objects.create(status='failed', error_message=error_msg[:1000], **log_fields),
+                    robust=True,
+                )
             logger.error(f"Email FAILED: [{category}] {subject} -> {to_email} | Error: {error_msg}")
             
             if not fail_silently:
                 raise
             
             return False
+        
+        # Mark as sent. Status writes wait for the caller's transaction to
+        # commit (immediately when there is none) and never fail the send.
+        if log_entry:
+            transaction.on_commit(log_entry.mark_sent, robust=True)
+        elif persist_log:
+            sent_at = timezone.now()
+            transaction.on_commit(
+                lambda: EmailLog.objects.create(status='sent', sent_at=sent_at, **log_fields),
+                robust=True,
+            )
+        logger.info(f"Email sent successfully: [{category}] {subject} -> {to_email}")
+        
+        return True
     
     # ========================================
     # Admin Notification Methods
@@ -118,120 +276,84 @@ class NotificationService:
         Returns:
             bool: True if notification sent successfully
         """
-        subject = f"[Contact Form] {contact_msg.get_subject_display()} - {contact_msg.full_name}"
+        admin_email = cls.get_admin_email()
+        if not admin_email:
+            logger.info("Admin notifications disabled: ADMIN_EMAIL is not set")
+            return False
         
-        body = f"""
-════════════════════════════════════════════════════════════
-📬 NEW CONTACT MESSAGE RECEIVED
-════════════════════════════════════════════════════════════
-
-From: {contact_msg.full_name}
-Email: {contact_msg.email}
-Subject: {contact_msg.get_subject_display()}
-Date: {contact_msg.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}
-IP Address: {contact_msg.ip_address or 'Unknown'}
-
-────────────────────────────────────────────────────────────
-MESSAGE:
-────────────────────────────────────────────────────────────
-
-{contact_msg.message}
-
-────────────────────────────────────────────────────────────
-ATTACHMENT: {'✓ Yes - ' + contact_msg.attachment_filename if contact_msg.has_attachment else '✗ None'}
-────────────────────────────────────────────────────────────
-
-Reply directly to: {contact_msg.email}
-
----
-This notification was sent by the {getattr(settings, 'BRAND_DOMAIN', 'FreeHousePlan.com')} Contact System.
-Manage messages: {getattr(settings, 'SITE_URL', 'http://localhost:8000')}/admin/core/contactmessage/
-"""
+        subject_display = contact_msg.get_subject_display()
+        subject = f"[Contact Form] {subject_display} - {contact_msg.full_name}"
+        
+        # Resolve the attachment once; body, path and name all depend on it.
+        attachment_name = contact_msg.attachment_filename
+        attachment_path = contact_msg.attachment.path if attachment_name else None
+        
+        body = _CONTACT_BODY.format_map({
+            'name': contact_msg.full_name,
+            'email': contact_msg.email,
+            'subject': subject_display,
+            'date': contact_msg.created_at.strftime('%Y-%m-%d %H:%M:%S UTC'),
+            'ip': contact_msg.ip_address or 'Unknown',
+            'message': contact_msg.message,
+            'attachment': ('✓ Yes - ' + attachment_name) if attachment_name else '✗ None',
+            'brand_domain': _BRAND_DOMAIN,
+            'site_url': _SITE_URL,
+        })
         
         return cls.send_email(
-            to_email=cls.get_admin_email(),
+            to_email=admin_email,
             subject=subject,
             body=body,
             category='contact_admin',
-            attachment_path=contact_msg.attachment.path if contact_msg.has_attachment else None,
-            attachment_name=contact_msg.attachment_filename if contact_msg.has_attachment else None,
+            attachment_path=attachment_path,
+            attachment_name=attachment_name,
             reply_to=contact_msg.email,
             related_contact_id=contact_msg.pk,
             fail_silently=True,  # Don't fail user's submission if email fails
         )
     
     @classmethod
-    def notify_admin_new_order(cls, order):
+    def notify_admin_new_order(cls, order, connection=None):
         """
         Send admin notification when a new order is placed.
         Includes receipt attachment if present.
         
         Args:
             order: Order instance
+            connection: Open mail backend shared with other sends (optional)
             
         Returns:
             bool: True if notification sent successfully
         """
+        admin_email = cls.get_admin_email()
+        if not admin_email:
+            logger.info("Admin notifications disabled: ADMIN_EMAIL is not set")
+            return False
+        
         subject = f"[New Order] {order.order_number} - {order.plan.title} - ${order.price_paid}"
         
-        receipt_info = ""
-        if order.receipt_file:
-            receipt_info = f"""
-────────────────────────────────────────────────────────────
-PAYMENT RECEIPT: ✓ ATTACHED
-────────────────────────────────────────────────────────────
-Receipt file is attached to this email for verification.
-"""
-        else:
-            receipt_info = """
-────────────────────────────────────────────────────────────
-PAYMENT RECEIPT: ✗ NOT UPLOADED
-────────────────────────────────────────────────────────────
-Customer has not uploaded a receipt yet.
-"""
+        receipt_info = _RECEIPT_ATTACHED if order.receipt_file else _RECEIPT_MISSING
         
-        body = f"""
-════════════════════════════════════════════════════════════
-💰 NEW ORDER RECEIVED - ACTION REQUIRED
-════════════════════════════════════════════════════════════
-
-Order Number: {order.order_number}
-Status: {order.get_payment_status_display()}
-Created: {order.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}
-
-────────────────────────────────────────────────────────────
-CUSTOMER INFORMATION:
-────────────────────────────────────────────────────────────
-
-Name: {order.buyer_name or 'Not provided'}
-Email: {order.buyer_email}
-
-────────────────────────────────────────────────────────────
-ORDER DETAILS:
-────────────────────────────────────────────────────────────
-
-Plan: {order.plan.title}
-Reference: {order.plan.reference}
-Price: ${order.price_paid} {order.currency}
-Payment Method: {order.get_payment_method_display() if order.payment_method else 'Not specified'}
-Payment Provider: {order.get_payment_provider_display()}
-{receipt_info}
-────────────────────────────────────────────────────────────
-REQUIRED ACTION:
-────────────────────────────────────────────────────────────
-
-1. Review the payment receipt
-2. Verify payment was received to your account
-3. Approve or reject the order in the admin panel
-
-Admin Panel: {getattr(settings, 'SITE_URL', 'http://localhost:8000')}/admin/orders/order/{order.pk}/change/
-
----
-This notification was sent by the {getattr(settings, 'BRAND_DOMAIN', 'FreeHousePlan.com')} Order System.
-"""
+        body = _ORDER_BODY.format_map({
+            'order_number': order.order_number,
+            'status': order.get_payment_status_display(),
+            'created': order.created_at.strftime('%Y-%m-%d %H:%M:%S UTC'),
+            'buyer_name': order.buyer_name or 'Not provided',
+            'buyer_email': order.buyer_email,
+            'plan_title': order.plan.title,
+            'plan_reference': order.plan.reference,
+            'price': order.price_paid,
+            'currency': order.currency,
+            'payment_method': order.get_payment_method_display() if order.payment_method else 'Not specified',
+            'payment_provider': order.get_payment_provider_display(),
+            'receipt_info': receipt_info,
+            'order_pk': order.pk,
+            'brand_domain': _BRAND_DOMAIN,
+            'site_url': _SITE_URL,
+        })
         
         return cls.send_email(
-            to_email=cls.get_admin_email(),
+            to_email=admin_email,
             subject=subject,
             body=body,
             category='order_admin',
@@ -240,6 +362,7 @@ This notification was sent by the {getattr(settings, 'BRAND_DOMAIN', 'FreeHouseP
             reply_to=order.buyer_email,
             related_order_id=order.pk,
             fail_silently=True,  # Don't fail user's submission if email fails
+            connection=connection,
         )
     
     @classmethod
@@ -253,35 +376,28 @@ This notification was sent by the {getattr(settings, 'BRAND_DOMAIN', 'FreeHouseP
         Returns:
             bool: True if notification sent successfully
         """
+        admin_email = cls.get_admin_email()
+        if not admin_email:
+            logger.info("Admin notifications disabled: ADMIN_EMAIL is not set")
+            return False
+        
         subject = f"[Receipt Uploaded] {order.order_number} - Needs Verification"
         
-        body = f"""
-════════════════════════════════════════════════════════════
-📎 PAYMENT RECEIPT UPLOADED - VERIFICATION NEEDED
-════════════════════════════════════════════════════════════
-
-Order Number: {order.order_number}
-Customer: {order.buyer_name or 'Not provided'} ({order.buyer_email})
-
-Plan: {order.plan.title}
-Price: ${order.price_paid} {order.currency}
-Payment Method: {order.get_payment_method_display() if order.payment_method else 'Not specified'}
-
-────────────────────────────────────────────────────────────
-RECEIPT ATTACHED
-────────────────────────────────────────────────────────────
-
-Please review the attached receipt and verify payment.
-
-Action required: Approve or reject in admin panel
-Admin Panel: {getattr(settings, 'SITE_URL', 'http://localhost:8000')}/admin/orders/order/{order.pk}/change/
-
----
-This notification was sent by the {getattr(settings, 'BRAND_DOMAIN', 'FreeHousePlan.com')} Order System.
-"""
+        body = _RECEIPT_BODY.format_map({
+            'order_number': order.order_number,
+            'buyer_name': order.buyer_name or 'Not provided',
+            'buyer_email': order.buyer_email,
+            'plan_title': order.plan.title,
+            'price': order.price_paid,
+            'currency': order.currency,
+            'payment_method': order.get_payment_method_display() if order.payment_method else 'Not specified',
+            'order_pk': order.pk,
+            'brand_domain': _BRAND_DOMAIN,
+            'site_url': _SITE_URL,
+        })
         
         return cls.send_email(
-            to_email=cls.get_admin_email(),
+            to_email=admin_email,
             subject=subject,
             body=body,
             category='order_admin',
@@ -299,9 +415,9 @@ def notify_admin_new_contact(contact_msg):
     return NotificationService.notify_admin_new_contact(contact_msg)
 
 
-def notify_admin_new_order(order):
+def notify_admin_new_order(order, connection=None):
     """Send admin notification for new order."""
-    return NotificationService.notify_admin_new_order(order)
+    return NotificationService.notify_admin_new_order(order, connection=connection)
 
 
 def notify_admin_receipt_uploaded(order):
@@ -0,0 +1,52 @@
+"""Background delivery of notification emails.
+
+Emails are handed to a small per-process thread pool once the surrounding
+transaction commits, so SMTP latency and retries never block a request.
+Tasks take primary keys rather than model instances and reload the row in
+the worker. Set NOTIFICATIONS_ASYNC = False to send inline (e.g. in tests).
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from .services import NotificationService
+
+logger = logging.getLogger('notifications')
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='notifications')
+
+
+def _run(func, *args):
+    try:
+        func(*args)
+    except Exception:
+        logger.exception(f"Background notification task {func.__name__} failed")
+    finally:
+        close_old_connections()
+
+
+def task(func):
+    """Give ``func`` a ``delay(*args)`` that runs it off the request path."""
+
+    def delay(*args):
+        if not getattr(settings, 'NOTIFICATIONS_ASYNC', True):
+            return func(*args)
+        transaction.on_commit(lambda: _executor.submit(_run, func, *args))
+        return None
+
+    func.delay = delay
+    return func
+
+
+@task
+def notify_admin_new_contact_task(contact_id):
+    """Send the admin notification for a saved ContactMessage."""
+    from apps.core.models import ContactMessage
+
+    contact_msg = ContactMessage.objects.filter(pk=contact_id).first()
+    if contact_msg is None:
+        logger.warning(f"Contact message {contact_id} vanished before notification")
+        return False
+    return NotificationService.notify_admin_new_contact(contact_msg)
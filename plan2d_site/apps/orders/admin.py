@@ -6,6 +6,50 @@ from django.utils.html import format_html
 from django.urls import reverse
 from django.utils import timezone
 from .models import Order
+from .tasks import send_payment_approved_emails_task, send_payment_rejected_emails_task
+
+
+_STATUS_COLORS = {
+    Order.PENDING: '#ffc107',  # yellow
+    Order.PROCESSING: '#17a2b8',  # blue
+    Order.COMPLETED: '#28a745',  # green
+    Order.FAILED: '#dc3545',  # red
+    Order.REJECTED: '#dc3545',  # red
+    Order.REFUNDED: '#6c757d',  # gray
+}
+
+
+def _status_badge_html(status, label):
+    return format_html(
+        '<span style="background-color: {}; color: white; padding: 3px 8px; '
+        'border-radius: 3px; font-size: 11px; font-weight: bold;">{}</span>',
+        _STATUS_COLORS.get(status, '#6c757d'), label.upper()
+    )
+
+
+# Changelist badges depend only on the status, so render each one once.
+_STATUS_BADGES = {
+    status: _status_badge_html(status, str(label))
+    for status, label in Order.STATUS_CHOICES
+}
+_PAYMENT_METHOD_LABELS = dict(Order.PAYMENT_METHOD_CHOICES)
+_PENDING_VERIFICATION = format_html('<span style="color: orange;">{}</span>', '⏳ Pending')
+
+# Bulk actions stream primary keys and update them this many at a time.
+_ACTION_BATCH_SIZE = 200
+
+# Columns the changelist actually renders; skips the TextFields and the rest.
+_CHANGELIST_FIELDS = (
+    'order_number',
+    'buyer_email',
+    'payment_method',
+    'price_paid',
+    'payment_status',
+    'receipt_file',
+    'verified_at',
+    'created_at',
+    'plan__title',
+)
 
 
 @admin.register(Order)
@@ -17,7 +61,7 @@ class OrderAdmin(admin.ModelAdmin):
         'order_number',
         'buyer_email',
         'plan_link',
-        'payment_method',
+        'payment_method_label',
         'price_paid',
         'status_badge',
         'receipt_preview',
@@ -51,6 +95,7 @@ class OrderAdmin(admin.ModelAdmin):
         'download_link',
         'receipt_image_preview',
     ]
+    list_select_related = ('plan',)
     list_per_page = 50
     date_hierarchy = 'created_at'
     ordering = ['-created_at']
@@ -110,12 +155,29 @@ class OrderAdmin(admin.ModelAdmin):
     
     actions = ['approve_payments', 'reject_payments', 'reset_download_count']
     
+    def get_queryset(self, request):
+        """
+        Load only the list columns on the changelist (and the bulk actions
+        posted to it); change pages get full rows with plan and verifier.
+        """
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name == f'{self.opts.app_label}_{self.opts.model_name}_changelist':
+            return queryset.select_related('plan').only(*_CHANGELIST_FIELDS)
+        return queryset.select_related('plan', 'verified_by')
+    
     def plan_link(self, obj):
         """Link to plan detail."""
         url = reverse('admin:plans_plan_change', args=[obj.plan.pk])
         return format_html('<a href="{}">{}</a>', url, obj.plan.title)
     plan_link.short_description = 'Plan'
     
+    def payment_method_label(self, obj):
+        """Choice label from a prebuilt map (Django rebuilds the choices dict per row)."""
+        return _PAYMENT_METHOD_LABELS.get(obj.payment_method) or self.get_empty_value_display()
+    payment_method_label.short_description = 'Payment method'
+    payment_method_label.admin_order_field = 'payment_method'
+    
     def receipt_preview(self, obj):
         """Small thumbnail of receipt in list view."""
         if obj.receipt_file:
@@ -151,42 +213,31 @@ class OrderAdmin(admin.ModelAdmin):
                 '<span style="color: green;">✓ {}</span>',
                 obj.verified_at.strftime('%Y-%m-%d')
             )
-        return format_html('<span style="color: orange;">⏳ Pending</span>')
+        return _PENDING_VERIFICATION
     verified_status.short_description = 'Verified'
     
     def status_badge(self, obj):
         """Visual badge for payment status."""
-        colors = {
-            Order.PENDING: '#ffc107',  # yellow
-            Order.PROCESSING: '#17a2b8',  # blue
-            Order.COMPLETED: '#28a745',  # green
-            Order.FAILED: '#dc3545',  # red
-            Order.REJECTED: '#dc3545',  # red
-            Order.REFUNDED: '#6c757d',  # gray
-        }
-        color = colors.get(obj.payment_status, '#6c757d')
-        
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 8px; '
-            'border-radius: 3px; font-size: 11px; font-weight: bold;">{}</span>',
-            color, obj.get_payment_status_display().upper()
-        )
+        badge = _STATUS_BADGES.get(obj.payment_status)
+        if badge is None:
+            badge = _status_badge_html(obj.payment_status, obj.payment_status)
+        return badge
     status_badge.short_description = 'Status'
     
     def download_status(self, obj):
         """Show download usage."""
-        percentage = (obj.download_count / obj.max_downloads) * 100 if obj.max_downloads > 0 else 0
+        count, limit = obj.download_count, obj.max_downloads
         
-        if obj.download_count >= obj.max_downloads:
+        if count >= limit:
             color = 'red'
-        elif percentage >= 80:
+        elif 5 * count >= 4 * limit:  # at least 80% used, in integer math
             color = 'orange'
         else:
             color = 'green'
         
         return format_html(
             '<span style="color: {}; font-weight: bold;">{}/{}</span>',
-            color, obj.download_count, obj.max_downloads
+            color, count, limit
         )
     download_status.short_description = 'Downloads'
     
@@ -204,32 +255,61 @@ class OrderAdmin(admin.ModelAdmin):
     
     # Bulk Actions
     
+    def _verify_pending(self, request, queryset, **changes):
+        """
+        Apply a verification outcome to the pending orders in ``queryset``,
+        one UPDATE per batch of primary keys; returns the keys of the orders
+        this call actually changed.
+        """
+        now = timezone.now()
+        changes.update(verified_at=now, verified_by=request.user, updated_at=now)
+        # Materialise the keys first: the UPDATEs below move rows out of the
+        # filtered set, which is unsafe while a cursor over it is still open.
+        pending = list(queryset.filter(payment_status=Order.PENDING).values_list('pk', flat=True))
+        updated = []
+        for start in range(0, len(pending), _ACTION_BATCH_SIZE):
+            updated += self._update_pending(pending[start:start + _ACTION_BATCH_SIZE], changes)
+        return updated
+    
+    def _update_pending(self, pks, changes):
+        # Orders verified concurrently elsewhere are no longer pending and are
+        # skipped by the UPDATE; the verification timestamp picks out ours.
+        Order.objects.filter(pk__in=pks, payment_status=Order.PENDING).update(**changes)
+        return list(
+            Order.objects.filter(
+                pk__in=pks,
+                payment_status=changes['payment_status'],
+                verified_at=changes['verified_at'],
+            ).values_list('pk', flat=True)
+        )
+    
     def approve_payments(self, request, queryset):
         """Approve manual payments and grant download access."""
-        updated = 0
-        for order in queryset.filter(payment_status=Order.PENDING):
-            order.approve_payment(
-                admin_user=request.user,
-                comment=f"Approved by {request.user.username} via bulk action"
-            )
-            updated += 1
+        order_ids = self._verify_pending(
+            request,
+            queryset,
+            payment_status=Order.COMPLETED,
+            completed_at=timezone.now(),
+            admin_comment=f"Approved by {request.user.username} via bulk action",
+        )
+        send_payment_approved_emails_task.delay(order_ids)
         
-        self.message_user(request, f'{updated} payment(s) approved. Customers notified via email.')
+        self.message_user(request, f'{len(order_ids)} payment(s) approved. Customers notified via email.')
     approve_payments.short_description = '✓ Approve selected payments'
     
     def reject_payments(self, request, queryset):
         """Reject manual payments with reason."""
-        updated = 0
-        for order in queryset.filter(payment_status=Order.PENDING):
-            order.reject_payment(
-                admin_user=request.user,
-                comment="Payment receipt did not match. Please resubmit with correct details."
-            )
-            updated += 1
+        order_ids = self._verify_pending(
+            request,
+            queryset,
+            payment_status=Order.REJECTED,
+            admin_comment="Payment receipt did not match. Please resubmit with correct details.",
+        )
+        send_payment_rejected_emails_task.delay(order_ids)
         
         self.message_user(
             request, 
-            f'{updated} payment(s) rejected. Customers notified via email.',
+            f'{len(order_ids)} payment(s) rejected. Customers notified via email.',
             level='warning'
         )
     reject_payments.short_description = '✗ Reject selected payments'
@@ -5,6 +5,19 @@ from django import forms
 from .models import Order
 from django.core.exceptions import ValidationError
 
+_MAX_RECEIPT_SIZE = 10 * 1024 * 1024
+
+# Leading bytes of the accepted receipt formats: PNG, JPEG, GIF, PDF.
+# Sniffing the file itself avoids trusting the browser's Content-Type.
+_RECEIPT_SIGNATURES = (
+    b'\x89PNG\r\n\x1a\n',
+    b'\xff\xd8\xff',
+    b'GIF87a',
+    b'GIF89a',
+    b'%PDF-',
+)
+_SIGNATURE_LENGTH = max(len(signature) for signature in _RECEIPT_SIGNATURES)
+
 
 class ReceiptUploadForm(forms.ModelForm):
     """
@@ -51,15 +64,14 @@ class ReceiptUploadForm(forms.ModelForm):
         
         if receipt:
             # Check file size (max 10MB)
-            if receipt.size > 10 * 1024 * 1024:
+            if receipt.size > _MAX_RECEIPT_SIZE:
                 raise ValidationError('Receipt file size cannot exceed 10MB.')
             
-            # Check file type
-            allowed_types = [
-                'image/jpeg', 'image/jpg', 'image/png', 'image/gif',
-                'application/pdf'
-            ]
-            if receipt.content_type not in allowed_types:
+            # Check file type from its first bytes
+            receipt.seek(0)
+            head = receipt.read(_SIGNATURE_LENGTH)
+            receipt.seek(0)
+            if not head.startswith(_RECEIPT_SIGNATURES):
                 raise ValidationError(
                     'Only image files (JPEG, PNG, GIF) and PDF are allowed.'
                 )
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_alter_order_plan'),
+        ('plans', '0022_plan_showcase_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='payment_status',
+            field=models.CharField(choices=[('pending', 'Pending Verification'), ('processing', 'Processing'), ('completed', 'Approved'), ('failed', 'Failed'), ('rejected', 'Rejected'), ('refunded', 'Refunded')], default='pending', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['-created_at'], name='ord_created_desc_idx'),
+        ),
+    ]
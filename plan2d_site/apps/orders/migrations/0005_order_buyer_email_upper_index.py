@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:20
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0004_order_created_desc_index'),
+        ('plans', '0022_plan_showcase_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='orders_orde_buyer_e_3f261e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(django.db.models.functions.text.Upper('buyer_email'), models.OrderBy(models.F('created_at'), descending=True), name='ord_buyer_email_upper_idx'),
+        ),
+    ]
@@ -3,11 +3,14 @@ Order models for managing plan purchases.
 Designed to work without user accounts and support multiple payment providers.
 """
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.core.validators import EmailValidator
-import uuid
 import secrets
 
+from .tasks import send_payment_approved_emails_task, send_payment_rejected_emails_task
+
 
 class Order(models.Model):
     """
@@ -91,11 +94,12 @@ class Order(models.Model):
     )
     
     # Payment Information
+    # No db_index: the (payment_status, -created_at) index in Meta covers
+    # status filters, so a single-column index would only slow down writes.
     payment_status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
         default=PENDING,
-        db_index=True
     )
     payment_provider = models.CharField(
         max_length=50,
@@ -141,6 +145,9 @@ class Order(models.Model):
     )
     
     # Security & Access Control
+    # The unique index is what /download/<token>/ uses: a single-row probe.
+    # Status and expiry are checked on the fetched row (which the view needs
+    # in full anyway), so no composite or partial token index is kept.
     access_token = models.CharField(
         max_length=64,
         unique=True,
@@ -180,8 +187,12 @@ class Order(models.Model):
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['buyer_email', '-created_at']),
+            # "My orders" lookup: buyer_email__iexact, newest first.
+            models.Index(Upper('buyer_email'), F('created_at').desc(), name='ord_buyer_email_upper_idx'),
+            # Also serves plain payment_status lookups (leading column).
             models.Index(fields=['payment_status', '-created_at']),
+            # Admin date_hierarchy drill-down and default ordering.
+            models.Index(fields=['-created_at'], name='ord_created_desc_idx'),
         ]
         verbose_name = 'Order'
         verbose_name_plural = 'Orders'
@@ -201,13 +212,12 @@ class Order(models.Model):
     def generate_order_number():
         """Generate unique order number: ORD-YYYYMMDD-RANDOM"""
         date_part = timezone.now().strftime('%Y%m%d')
-        random_part = uuid.uuid4().hex[:8].upper()
-        return f"ORD-{date_part}-{random_part}"
+        return f"ORD-{date_part}-{secrets.token_hex(4).upper()}"
     
     @staticmethod
     def generate_access_token():
-        """Generate cryptographically secure access token."""
-        return secrets.token_urlsafe(48)
+        """Generate cryptographically secure access token (256 bits)."""
+        return secrets.token_urlsafe(32)
     
     def mark_completed(self):
         """Mark order as completed and record timestamp."""
@@ -218,32 +228,32 @@ class Order(models.Model):
     
     def approve_payment(self, admin_user, comment=''):
         """Approve manual payment after verification."""
-        from .emails import send_payment_approved_email
-        
         self.payment_status = self.COMPLETED
         self.verified_at = timezone.now()
         self.verified_by = admin_user
         self.completed_at = timezone.now()
+        update_fields = ['payment_status', 'verified_at', 'verified_by', 'completed_at', 'updated_at']
         if comment:
             self.admin_comment = comment
-        self.save()
+            update_fields.append('admin_comment')
+        self.save(update_fields=update_fields)
         
-        # Send approval email
-        send_payment_approved_email(self)
+        # Email the customer once this transaction commits
+        send_payment_approved_emails_task.delay([self.pk])
     
     def reject_payment(self, admin_user, comment=''):
         """Reject manual payment."""
-        from .emails import send_payment_rejected_email
-        
         self.payment_status = self.REJECTED
         self.verified_at = timezone.now()
         self.verified_by = admin_user
+        update_fields = ['payment_status', 'verified_at', 'verified_by', 'updated_at']
         if comment:
             self.admin_comment = comment
-        self.save()
+            update_fields.append('admin_comment')
+        self.save(update_fields=update_fields)
         
-        # Send rejection email
-        send_payment_rejected_email(self)
+        # Email the customer once this transaction commits
+        send_payment_rejected_emails_task.delay([self.pk])
     
     def can_download(self):
         """Check if download is still allowed."""
@@ -262,9 +272,25 @@ class Order(models.Model):
         return True
     
     def increment_download(self):
-        """Track download attempt."""
+        """
+        Track download attempt.
+        Returns False (counting nothing) if the limit was already reached.
+        """
+        # One conditional UPDATE: concurrent downloads can neither overwrite
+        # each other's count nor both take the last remaining download.
+        claimed = Order.objects.filter(
+            pk=self.pk,
+            download_count__lt=F('max_downloads'),
+        ).update(
+            download_count=F('download_count') + 1,
+            updated_at=timezone.now(),
+        )
+        if not claimed:
+            self.refresh_from_db(fields=['download_count'])
+            return False
+        # Keep this instance roughly in step without another query.
         self.download_count += 1
-        self.save(update_fields=['download_count', 'updated_at'])
+        return True
     
     @property
     def is_expired(self):
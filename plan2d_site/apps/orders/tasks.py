@@ -0,0 +1,66 @@
+"""
+Background delivery of order emails.
+
+Uses the notifications task runner: work is queued after the surrounding
+transaction commits and each task reloads its orders by primary key, so the
+checkout and admin requests never wait on SMTP.
+"""
+import logging
+
+from django.core.mail import get_connection
+
+from apps.notifications.services import notify_admin_new_order
+from apps.notifications.tasks import task
+
+from .emails import (
+    send_order_confirmation_email,
+    send_payment_approved_emails,
+    send_payment_rejected_emails,
+)
+
+logger = logging.getLogger('orders')
+
+
+def _load_orders(order_ids):
+    # models.py imports this module, so resolve Order at call time.
+    from .models import Order
+
+    return list(Order.objects.select_related('plan').filter(pk__in=order_ids))
+
+
+@task
+def send_order_emails_task(order_id):
+    """Email the buyer's order confirmation and notify the admin."""
+    orders = _load_orders([order_id])
+    if not orders:
+        logger.warning(f"Order {order_id} vanished before its emails were sent")
+        return False
+    order = orders[0]
+    
+    # Buyer confirmation and admin notification share one SMTP session
+    with get_connection() as connection:
+        send_order_confirmation_email(order, connection=connection)
+        
+        # Send notification to admin (with receipt attached)
+        try:
+            notify_admin_new_order(order, connection=connection)
+            logger.info(f"Admin notified of new order: {order.order_number}")
+        except Exception as e:
+            logger.error(f"Failed to notify admin for order {order.order_number}: {e}")
+    return True
+
+
+@task
+def send_payment_approved_emails_task(order_ids):
+    """Email download links for approved orders."""
+    sent = send_payment_approved_emails(_load_orders(order_ids))
+    logger.info(f"Sent {sent} payment approval email(s)")
+    return sent
+
+
+@task
+def send_payment_rejected_emails_task(order_ids):
+    """Email resubmission instructions for rejected orders."""
+    sent = send_payment_rejected_emails(_load_orders(order_ids))
+    logger.info(f"Sent {sent} payment rejection email(s)")
+    return sent
@@ -1,3 +1,173 @@
-from django.test import TestCase
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here
+from django.contrib.admin.sites import site
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.plans.models import Category, Plan
+
+from .admin import OrderAdmin
+from .forms import ReceiptUploadForm
+from .models import Order
+
+
+class OrderTestMixin:
+	"""Shared plan and order fixtures."""
+
+	def setUp(self):
+		category = Category.objects.create(name="Modern", description="Modern living", display_order=1)
+		self.plan = Plan.objects.create(
+			title='Order Test Plan',
+			category=category,
+			bedrooms=3,
+			bathrooms=Decimal('2.5'),
+			total_area_sqm=Decimal('120.0'),
+			description='Detailed description for testing.',
+			price=Decimal('250.00'),
+		)
+
+	def _create_order(self, **overrides):
+		payload = {
+			'buyer_email': 'buyer@example.com',
+			'plan': self.plan,
+			'price_paid': Decimal('250.00'),
+		}
+		payload.update(overrides)
+		return Order.objects.create(**payload)
+
+
+class ReceiptUploadFormTests(TestCase):
+	"""Receipts are accepted by their leading bytes, not the declared type."""
+
+	def _form(self, content, content_type):
+		receipt = SimpleUploadedFile('receipt.pdf', content, content_type=content_type)
+		return ReceiptUploadForm(
+			data={'buyer_email': 'buyer@example.com', 'payment_method': Order.BANK_TRANSFER},
+			files={'receipt_file': receipt},
+		)
+
+	def test_accepts_pdf_receipt(self):
+		form = self._form(b'%PDF-1.7\n...', 'application/pdf')
+		self.assertTrue(form.is_valid(), form.errors)
+		# The check rewinds the file so it is saved in full.
+		self.assertEqual(form.cleaned_data['receipt_file'].read(), b'%PDF-1.7\n...')
+
+	def test_rejects_file_with_spoofed_content_type(self):
+		form = self._form(b'<?php echo "hi"; ?>', 'application/pdf')
+		self.assertFalse(form.is_valid())
+		self.assertIn('receipt_file', form.errors)
+
+
+class IncrementDownloadTests(OrderTestMixin, TestCase):
+	"""Each download claims one slot and never goes past the limit."""
+
+	def test_claims_a_download(self):
+		order = self._create_order(download_count=0, max_downloads=2)
+		self.assertTrue(order.increment_download())
+		self.assertEqual(order.download_count, 1)
+		order.refresh_from_db()
+		self.assertEqual(order.download_count, 1)
+
+	def test_refuses_once_the_limit_is_reached(self):
+		order = self._create_order(download_count=2, max_downloads=2)
+		self.assertFalse(order.increment_download())
+		order.refresh_from_db()
+		self.assertEqual(order.download_count, 2)
+
+	def test_stale_instance_cannot_take_the_last_download_twice(self):
+		order = self._create_order(download_count=1, max_downloads=2)
+		stale = Order.objects.get(pk=order.pk)
+		self.assertTrue(order.increment_download())
+		# The stale copy still believes one download is left.
+		self.assertEqual(stale.download_count, 1)
+		self.assertFalse(stale.increment_download())
+		self.assertEqual(stale.download_count, 2)
+		order.refresh_from_db()
+		self.assertEqual(order.download_count, 2)
+
+
+@override_settings(NOTIFICATIONS_ASYNC=False)
+class PaymentBulkActionTests(OrderTestMixin, TestCase):
+	"""Bulk approve / reject only touch, count and email pending orders."""
+
+	def setUp(self):
+		super().setUp()
+		self.admin_user = get_user_model().objects.create_superuser(
+			username='admin', email='admin@example.com', password='secret'
+		)
+		self.client.force_login(self.admin_user)
+		self.changelist_url = reverse('admin:orders_order_changelist')
+
+	def _run_action(self, action, orders):
+		return self.client.post(
+			self.changelist_url,
+			{'action': action, '_selected_action': [order.pk for order in orders]},
+			follow=True,
+		)
+
+	def test_approve_updates_and_emails_pending_orders_only(self):
+		pending = [self._create_order(buyer_email=f'buyer{i}@example.com') for i in range(3)]
+		rejected = self._create_order(buyer_email='rejected@example.com', payment_status=Order.REJECTED)
+
+		response = self._run_action('approve_payments', pending + [rejected])
+
+		self.assertContains(response, '3 payment(s) approved.')
+		for order in pending:
+			order.refresh_from_db()
+			self.assertEqual(order.payment_status, Order.COMPLETED)
+			self.assertEqual(order.verified_by, self.admin_user)
+			self.assertIsNotNone(order.completed_at)
+		rejected.refresh_from_db()
+		self.assertEqual(rejected.payment_status, Order.REJECTED)
+		self.assertEqual(
+			sorted(message.to[0] for message in mail.outbox),
+			sorted(order.buyer_email for order in pending),
+		)
+
+	def test_reject_updates_and_emails_pending_orders_only(self):
+		pending = self._create_order(buyer_email='pending@example.com')
+		completed = self._create_order(buyer_email='done@example.com', payment_status=Order.COMPLETED)
+
+		response = self._run_action('reject_payments', [pending, completed])
+
+		self.assertContains(response, '1 payment(s) rejected.')
+		pending.refresh_from_db()
+		completed.refresh_from_db()
+		self.assertEqual(pending.payment_status, Order.REJECTED)
+		self.assertEqual(completed.payment_status, Order.COMPLETED)
+		self.assertEqual([message.to for message in mail.outbox], [['pending@example.com']])
+
+	def test_orders_verified_concurrently_are_not_reported(self):
+		mine = self._create_order(buyer_email='mine@example.com')
+		theirs = self._create_order(buyer_email='theirs@example.com')
+		# Another admin approves ``theirs`` after our pending keys were read.
+		Order.objects.filter(pk=theirs.pk).update(
+			payment_status=Order.COMPLETED, verified_at=timezone.now()
+		)
+		model_admin = OrderAdmin(Order, site)
+		now = timezone.now()
+		updated = model_admin._update_pending(
+			[mine.pk, theirs.pk],
+			{
+				'payment_status': Order.REJECTED,
+				'verified_at': now,
+				'verified_by': self.admin_user,
+				'updated_at': now,
+			},
+		)
+		self.assertEqual(updated, [mine.pk])
+		theirs.refresh_from_db()
+		self.assertEqual(theirs.payment_status, Order.COMPLETED)
+
+	def test_large_selections_are_updated_in_batches(self):
+		orders = [self._create_order(buyer_email=f'bulk{i}@example.com') for i in range(5)]
+		with mock.patch('apps.orders.admin._ACTION_BATCH_SIZE', 2):
+			response = self._run_action('approve_payments', orders)
+		self.assertContains(response, '5 payment(s) approved.')
+		self.assertEqual(Order.objects.filter(payment_status=Order.COMPLETED).count(), 5)
+		self.assertEqual(len(mail.outbox), 5)
@@ -6,17 +6,81 @@ from django.views.generic import View, TemplateView
 from django.contrib import messages
 from django.http import FileResponse, Http404, HttpResponse
 from django.utils import timezone
+from django.utils.encoding import iri_to_uri
+from django.utils.http import content_disposition_header
+from django.conf import settings
+from django.db import transaction
 from django.core.exceptions import PermissionDenied
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
 from .models import Order
 from apps.plans.models import Plan
-from .emails import send_order_confirmation_email, send_payment_instructions_email
+from .emails import send_payment_instructions_email
 from .forms import ReceiptUploadForm
-from apps.notifications.services import notify_admin_new_order
-import mimetypes
+from .tasks import send_order_emails_task
 import logging
+import os
 
 logger = logging.getLogger('orders')
 
+# Paid plan files are validated as PDF on upload
+DOWNLOAD_CONTENT_TYPE = 'application/pdf'
+
+# Read plan files in 1 MB chunks rather than FileResponse's 4 KB default
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+
+# Behind nginx, let it send the file from an internal location (see settings)
+X_ACCEL_REDIRECT = getattr(settings, 'DOWNLOAD_X_ACCEL_REDIRECT', False)
+X_ACCEL_PREFIX = getattr(settings, 'DOWNLOAD_X_ACCEL_PREFIX', '/protected-media/')
+
+# Most recent orders listed on the "my orders" lookup page
+MY_ORDERS_LIMIT = 50
+
+# Columns each page actually reads; skips notes, receipts and plan content
+DOWNLOAD_FIELDS = (
+    'order_number', 'access_token', 'payment_status', 'download_count',
+    'max_downloads', 'access_expires_at',
+    'plan__title', 'plan__reference', 'plan__slug', 'plan__paid_plan_file',
+)
+MY_ORDERS_FIELDS = (
+    'order_number', 'access_token', 'created_at', 'payment_status',
+    'price_paid', 'download_count', 'max_downloads',
+    'plan__title', 'plan__reference', 'plan__bedrooms', 'plan__bathrooms',
+)
+
+# Manual payment details shown on the checkout page
+PAYMENT_INFO = {
+    'payoneer': {
+        'email': 'bacseried@gmail.com',
+        'holder': 'Issoufou Abdou Chéfou',
+    },
+    'bank': {
+        'name': 'Bank of Africa Niger',
+        'holder': 'Abdou Chefou Issoufou',
+        'currency': 'XOF',
+        'swift': 'AFRINENIXXX',
+        'iban': 'NE58NE0380100400440716000006',
+    }
+}
+
+
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+
+def _open_noatime(path):
+    """
+    Open ``path`` for reading without updating its access time, so serving
+    a download doesn't dirty the inode. Linux only allows O_NOATIME for the
+    file's owner; fall back to a normal open otherwise.
+    """
+    if _O_NOATIME:
+        try:
+            return os.fdopen(os.open(path, os.O_RDONLY | _O_NOATIME), 'rb')
+        except PermissionError:
+            pass
+    return open(path, 'rb')
+
 
 class CheckoutView(View):
     """
@@ -25,6 +89,19 @@ class CheckoutView(View):
     """
     template_name = 'orders/checkout.html'
     
+    @method_decorator(csrf_exempt)
+    def dispatch(self, request, *args, **kwargs):
+        # Spool receipts to a temporary file as they arrive; FileSystemStorage
+        # then moves that file into MEDIA_ROOT instead of writing out an
+        # in-memory copy. Handlers must be set before anything reads
+        # request.POST (CsrfViewMiddleware would), so CSRF is enforced below.
+        request.upload_handlers = [TemporaryFileUploadHandler(request)]
+        return self._csrf_protected_dispatch(request, *args, **kwargs)
+    
+    @method_decorator(csrf_protect)
+    def _csrf_protected_dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+    
     def get(self, request, plan_slug):
         """Display checkout page with payment instructions."""
         plan = get_object_or_404(Plan.objects.visible(), slug=plan_slug)
@@ -34,26 +111,11 @@ class CheckoutView(View):
             messages.error(request, "This plan is not available for purchase.")
             return redirect('plans:plan_detail', slug=plan_slug)
         
-        # Payment details
-        payment_info = {
-            'payoneer': {
-                'email': 'bacseried@gmail.com',
-                'holder': 'Issoufou Abdou Chéfou',
-            },
-            'bank': {
-                'name': 'Bank of Africa Niger',
-                'holder': 'Abdou Chefou Issoufou',
-                'currency': 'XOF',
-                'swift': 'AFRINENIXXX',
-                'iban': 'NE58NE0380100400440716000006',
-            }
-        }
-        
         form = ReceiptUploadForm()
         
         context = {
             'plan': plan,
-            'payment_info': payment_info,
+            'payment_info': PAYMENT_INFO,
             'form': form,
         }
         return render(request, self.template_name, context)
@@ -65,24 +127,20 @@ class CheckoutView(View):
         form = ReceiptUploadForm(request.POST, request.FILES)
         
         if form.is_valid():
-            # Create order with receipt
-            order = form.save(commit=False)
-            order.plan = plan
-            order.price_paid = plan.price
-            order.currency = 'USD'
-            order.payment_status = Order.PENDING
-            order.payment_provider = Order.MANUAL
-            order.save()
-            
-            # Send confirmation email to buyer
-            send_order_confirmation_email(order)
-            
-            # Send notification to admin (with receipt attached)
-            try:
-                notify_admin_new_order(order)
-                logger.info(f"Admin notified of new order: {order.order_number}")
-            except Exception as e:
-                logger.error(f"Failed to notify admin for order {order.order_number}: {e}")
+            # Create order with receipt, charging the plan's price as of commit
+            with transaction.atomic():
+                order = form.save(commit=False)
+                order.plan = plan
+                order.price_paid = Plan.objects.select_for_update().values_list(
+                    'price', flat=True
+                ).get(pk=plan.pk)
+                order.currency = 'USD'
+                order.payment_status = Order.PENDING
+                order.payment_provider = Order.MANUAL
+                order.save()
+                
+                # Buyer confirmation and admin notification go out after commit
+                send_order_emails_task.delay(order.pk)
             
             messages.success(
                 request,
@@ -92,29 +150,17 @@ class CheckoutView(View):
             
             return redirect('orders:order_confirmation', order_number=order.order_number)
         else:
-            # Show errors
-            for field, errors in form.errors.items():
-                for error in errors:
-                    messages.error(request, f"{field}: {error}")
+            # Show errors (one message, so the message store is written once)
+            messages.error(request, "; ".join(
+                f"{field}: {error}"
+                for field, errors in form.errors.items()
+                for error in errors
+            ))
             
             # Re-render with form errors
-            payment_info = {
-                'payoneer': {
-                    'email': 'bacseried@gmail.com',
-                    'holder': 'Issoufou Abdou Chéfou',
-                },
-                'bank': {
-                    'name': 'Bank of Africa Niger',
-                    'holder': 'Abdou Chefou Issoufou',
-                    'currency': 'XOF',
-                    'swift': 'AFRINENIXXX',
-                    'iban': 'NE58NE0380100400440716000006',
-                }
-            }
-            
             context = {
                 'plan': plan,
-                'payment_info': payment_info,
+                'payment_info': PAYMENT_INFO,
                 'form': form,
             }
             return render(request, self.template_name, context)
@@ -144,40 +190,56 @@ class SecureDownloadView(View):
     
     def get(self, request, access_token):
         """Serve file if valid token and download allowed."""
-        # Validate token
-        try:
-            order = Order.objects.select_related('plan').get(access_token=access_token)
-        except Order.DoesNotExist:
+        # Validate token (unique index lookup; no exception on bad tokens)
+        order = Order.objects.select_related('plan').only(*DOWNLOAD_FIELDS).filter(
+            access_token=access_token
+        ).first()
+        if order is None:
             raise Http404("Invalid download link.")
         
         # Check if download is allowed
         if not order.can_download():
-            context = {
-                'order': order,
-                'reason': self._get_denial_reason(order)
-            }
-            return render(request, 'orders/download_denied.html', context, status=403)
+            return self._denied(request, order)
         
         # Get file path
         if not order.plan.paid_plan_file:
             raise Http404("Plan file not found.")
         
         file_path = order.plan.paid_plan_file.path
+        filename = order.plan.download_filename
         
-        # Increment download count
-        order.increment_download()
+        # Increment download count (fails if a concurrent download used the last one)
+        if not order.increment_download():
+            return self._denied(request, order)
+        
+        if X_ACCEL_REDIRECT:
+            # nginx streams the file with sendfile(); the worker is freed now
+            response = HttpResponse(content_type=DOWNLOAD_CONTENT_TYPE)
+            response['X-Accel-Redirect'] = iri_to_uri(X_ACCEL_PREFIX + order.plan.paid_plan_file.name)
+            response['Content-Disposition'] = content_disposition_header(True, filename)
+            return response
         
-        # Serve file
+        # Serve file (FileResponse sets Content-Length and Content-Disposition)
         try:
             response = FileResponse(
-                open(file_path, 'rb'),
-                content_type=mimetypes.guess_type(file_path)[0] or 'application/pdf'
+                _open_noatime(file_path),
+                as_attachment=True,
+                filename=filename,
+                content_type=DOWNLOAD_CONTENT_TYPE
             )
-            response['Content-Disposition'] = f'attachment; filename="{order.plan.reference}-{order.plan.slug}.pdf"'
+            response.block_size = DOWNLOAD_BLOCK_SIZE
             return response
         except FileNotFoundError:
             raise Http404("Plan file not found on server.")
     
+    def _denied(self, request, order):
+        """Render the download-denied page."""
+        context = {
+            'order': order,
+            'reason': self._get_denial_reason(order)
+        }
+        return render(request, 'orders/download_denied.html', context, status=403)
+    
     def _get_denial_reason(self, order):
         """Get human-readable reason for download denial."""
         if order.payment_status != Order.COMPLETED:
@@ -210,12 +272,14 @@ class MyOrdersView(View):
             messages.error(request, "Please enter your email address.")
             return render(request, self.template_name)
         
-        # Find orders for this email
-        orders = Order.objects.filter(
-            buyer_email=email
-        ).select_related('plan').order_by('-created_at')
+        # Find orders for this email (one query; emails are case-insensitive)
+        orders = list(
+            Order.objects.filter(
+                buyer_email__iexact=email
+            ).select_related('plan').only(*MY_ORDERS_FIELDS).order_by('-created_at')[:MY_ORDERS_LIMIT]
+        )
         
-        if not orders.exists():
+        if not orders:
             messages.info(request, f"No orders found for {email}")
         
         context = {
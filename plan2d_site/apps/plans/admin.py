@@ -1,9 +1,11 @@
+import itertools
 import json
 from urllib.parse import quote, unquote
 
 from django import forms
 from django.contrib import admin, messages
 from django.core.exceptions import ValidationError
+from django.db.models import Case, Count, IntegerField, Q, Value, When
 from django.shortcuts import get_object_or_404, redirect
 from django.template.response import TemplateResponse
 from django.urls import path, reverse
@@ -42,11 +44,80 @@ class CategoryAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """
+        Count each category's plans in the changelist query itself; other
+        views (change page, the plan form's category autocomplete) skip it.
+        """
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name == 'plans_category_changelist':
+            queryset = queryset.annotate(num_plans=Count('plans'))
+        return queryset
+
     def plan_count(self, obj):
         """Display number of plans in this category."""
-        count = obj.plans.count()
-        return format_html('<strong>{}</strong>', count)
+        return format_html('<strong>{}</strong>', obj.num_plans)
     plan_count.short_description = 'Plans'
+    plan_count.admin_order_field = 'num_plans'
+
+
+# language_content['fr'] keys and the form fields that fill them
+_FR_CONTENT_FIELDS = (
+    ('title', 'title_fr'),
+    ('description', 'description_fr'),
+    ('seo_title', 'seo_title_fr'),
+    ('seo_description', 'seo_description_fr'),
+)
+
+_ZIP_URL_HELP = (
+    'Enter the single Gumroad ZIP checkout URL. The ZIP must already include Metric and Imperial deliverables.'
+)
+
+# Placeholder and help text (None keeps the model's) for PlanAdminForm fields
+_FIELD_HINTS = {
+    'gumroad_url': (
+        'https://gumroad.com/l/your-product',
+        'Enter the Gumroad checkout URL for this plan. '
+        'Example: https://gumroad.com/l/your-product-code',
+    ),
+    'gumroad_revit_url': (
+        'https://gumroad.com/l/your-revit-file',
+        'Optional: link to the Gumroad product that delivers the editable Revit (.RVT) file. '
+        'Customers complete checkout on Gumroad.',
+    ),
+    'gumroad_ifc_url': (
+        'https://gumroad.com/l/your-ifc-file',
+        'Optional: link to the Gumroad product that delivers the IFC file. '
+        'No files are hosted locally.',
+    ),
+    'gumroad_paid_pdf_url': (
+        'https://gumroad.com/l/your-paid-pdf',
+        'Optional: dedicated Gumroad checkout link for the dimensioned PDF. '
+        'Clear this field or disable the toggle to hide the paid PDF offer.',
+    ),
+    'total_area_sqm': ('Enter total area in m²', None),
+    'total_area_sqft': ('Or enter total area in ft²', None),
+    'suggested_plot_size': (
+        'e.g., 15 x 20',
+        'Formats accepted: 15x20, 15 x 20, 15m x 20m (all in meters). '
+        'Letters and spaces are optional; feet are computed automatically.',
+    ),
+    **{
+        price_field: (
+            'e.g., 249.00',
+            f"Set the USD price for {label}. Leave blank only if this file is not offered.",
+        )
+        for price_field, label in (
+            ('price', 'the Standard Pack dimensioned PDF'),
+            ('revit_price', 'the Revit (RVT) deliverable'),
+            ('ifc_price', 'the IFC deliverable'),
+            ('pack_3_price', 'Pack 3'),
+        )
+    },
+    'pack_2_gumroad_zip_url': ('https://gumroad.com/l/your-pack-zip', _ZIP_URL_HELP),
+    'pack_3_gumroad_zip_url': ('https://gumroad.com/l/your-pack-zip', _ZIP_URL_HELP),
+}
 
 
 class PlanAdminForm(forms.ModelForm):
@@ -65,77 +136,20 @@ class PlanAdminForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._plot_size_conversion = None
-        fr_content = (self.instance.language_content or {}).get('fr', {}) if self.instance.pk else {}
-        self.fields['title_fr'].initial = fr_content.get('title')
-        self.fields['description_fr'].initial = fr_content.get('description')
-        self.fields['seo_title_fr'].initial = fr_content.get('seo_title')
-        self.fields['seo_description_fr'].initial = fr_content.get('seo_description')
-        
-        # Add help text for Gumroad fields
-        if 'gumroad_url' in self.fields:
-            self.fields['gumroad_url'].widget.attrs['placeholder'] = 'https://gumroad.com/l/your-product'
-            self.fields['gumroad_url'].help_text = (
-                'Enter the Gumroad checkout URL for this plan. '
-                'Example: https://gumroad.com/l/your-product-code'
-            )
-        if 'gumroad_revit_url' in self.fields:
-            self.fields['gumroad_revit_url'].widget.attrs['placeholder'] = 'https://gumroad.com/l/your-revit-file'
-            self.fields['gumroad_revit_url'].help_text = (
-                'Optional: link to the Gumroad product that delivers the editable Revit (.RVT) file. '
-                'Customers complete checkout on Gumroad.'
-            )
-        if 'gumroad_ifc_url' in self.fields:
-            self.fields['gumroad_ifc_url'].widget.attrs['placeholder'] = 'https://gumroad.com/l/your-ifc-file'
-            self.fields['gumroad_ifc_url'].help_text = (
-                'Optional: link to the Gumroad product that delivers the IFC file. '
-                'No files are hosted locally.'
-            )
-        if 'gumroad_paid_pdf_url' in self.fields:
-            self.fields['gumroad_paid_pdf_url'].widget.attrs['placeholder'] = 'https://gumroad.com/l/your-paid-pdf'
-            self.fields['gumroad_paid_pdf_url'].help_text = (
-                'Optional: dedicated Gumroad checkout link for the dimensioned PDF. '
-                'Clear this field or disable the toggle to hide the paid PDF offer.'
-            )
-        if 'total_area_sqm' in self.fields:
-            self.fields['total_area_sqm'].widget.attrs['placeholder'] = 'Enter total area in m²'
-        if 'total_area_sqft' in self.fields:
-            self.fields['total_area_sqft'].widget.attrs['placeholder'] = 'Or enter total area in ft²'
-        if 'suggested_plot_size' in self.fields:
-            self.fields['suggested_plot_size'].widget.attrs.setdefault('placeholder', 'e.g., 15 x 20')
-            self.fields['suggested_plot_size'].help_text = (
-                'Formats accepted: 15x20, 15 x 20, 15m x 20m (all in meters). '
-                'Letters and spaces are optional; feet are computed automatically.'
-            )
-        for price_field, label in (
-            ('price', 'the Standard Pack dimensioned PDF'),
-            ('revit_price', 'the Revit (RVT) deliverable'),
-            ('ifc_price', 'the IFC deliverable'),
-            ('pack_3_price', 'Pack 3'),
-        ):
-            if price_field in self.fields:
-                self.fields[price_field].widget.attrs.setdefault('placeholder', 'e.g., 249.00')
-                self.fields[price_field].help_text = (
-                    f"Set the USD price for {label}. "
-                    'Leave blank only if this file is not offered.'
-                )
-        for zip_field in ('pack_2_gumroad_zip_url', 'pack_3_gumroad_zip_url'):
-            if zip_field in self.fields:
-                self.fields[zip_field].widget.attrs['placeholder'] = 'https://gumroad.com/l/your-pack-zip'
-                self.fields[zip_field].help_text = (
-                    'Enter the single Gumroad ZIP checkout URL. The ZIP must already include Metric and Imperial deliverables.'
-                )
-
-    def clean_gumroad_url(self):
-        """Validate Gumroad URL format."""
-        url = self.cleaned_data.get('gumroad_url', '').strip()
-        if url:
-            if not (url.startswith('https://gumroad.com/') or 
-                    (url.startswith('https://') and '.gumroad.com/' in url)):
-                raise forms.ValidationError(
-                    'Please enter a valid Gumroad URL. '
-                    'URL must start with https://gumroad.com/ or https://*.gumroad.com/'
-                )
-        return url
+        # FR fields start out blank; only saved plans with overrides fill them.
+        language_content = self.instance.language_content if self.instance.pk else None
+        fr_content = language_content.get('fr') if language_content else None
+        if fr_content:
+            for key, field_name in _FR_CONTENT_FIELDS:
+                self.fields[field_name].initial = fr_content.get(key)
+
+        for name, (placeholder, help_text) in _FIELD_HINTS.items():
+            field = self.fields.get(name)
+            if field is None:
+                continue
+            field.widget.attrs.setdefault('placeholder', placeholder)
+            if help_text:
+                field.help_text = help_text
 
     def clean(self):
         """Cross-field validation for Gumroad payment configuration."""
@@ -187,55 +201,6 @@ class PlanAdminForm(forms.ModelForm):
         elif value is not None and value <= 0:
             self.add_error(field_name, f'{label} must be priced above zero or left blank when not offered.')
 
-    def clean_gumroad_revit_url(self):
-        url = self.cleaned_data.get('gumroad_revit_url', '').strip()
-        if url:
-            if not (url.startswith('https://gumroad.com/') or 
-                    (url.startswith('https://') and '.gumroad.com/' in url)):
-                raise forms.ValidationError(
-                    'Please enter a valid Gumroad URL. '
-                    'URL must start with https://gumroad.com/ or https://*.gumroad.com/'
-                )
-        return url
-
-    def clean_gumroad_ifc_url(self):
-        url = self.cleaned_data.get('gumroad_ifc_url', '').strip()
-        if url:
-            if not (url.startswith('https://gumroad.com/') or 
-                    (url.startswith('https://') and '.gumroad.com/' in url)):
-                raise forms.ValidationError(
-                    'Please enter a valid Gumroad URL. '
-                    'URL must start with https://gumroad.com/ or https://*.gumroad.com/'
-                )
-        return url
-
-    def clean_gumroad_paid_pdf_url(self):
-        url = self.cleaned_data.get('gumroad_paid_pdf_url', '').strip()
-        if url:
-            if not (url.startswith('https://gumroad.com/') or 
-                    (url.startswith('https://') and '.gumroad.com/' in url)):
-                raise forms.ValidationError(
-                    'Please enter a valid Gumroad URL. '
-                    'URL must start with https://gumroad.com/ or https://*.gumroad.com/'
-                )
-        return url
-
-    def clean_pack_2_gumroad_zip_url(self):
-        return self._clean_zip_field('pack_2_gumroad_zip_url')
-
-    def clean_pack_3_gumroad_zip_url(self):
-        return self._clean_zip_field('pack_3_gumroad_zip_url')
-
-    def _clean_zip_field(self, field_name):
-        url = (self.cleaned_data.get(field_name) or '').strip()
-        if url:
-            if not (url.startswith('https://gumroad.com/') or (
-                    url.startswith('https://') and '.gumroad.com/' in url)):
-                raise forms.ValidationError(
-                    'Gumroad ZIP URL must start with https://gumroad.com/ or https://*.gumroad.com/'
-                )
-        return url
-
     def clean_suggested_plot_size(self):
         value = (self.cleaned_data.get('suggested_plot_size') or '').strip()
         if not value:
@@ -252,12 +217,10 @@ class PlanAdminForm(forms.ModelForm):
         instance = super().save(commit=False)
         language_content = instance.language_content or {}
         fr_payload = {
-            'title': self.cleaned_data.get('title_fr', '').strip(),
-            'description': self.cleaned_data.get('description_fr', '').strip(),
-            'seo_title': self.cleaned_data.get('seo_title_fr', '').strip(),
-            'seo_description': self.cleaned_data.get('seo_description_fr', '').strip(),
+            key: value
+            for key, field_name in _FR_CONTENT_FIELDS
+            if (value := self.cleaned_data.get(field_name, '').strip())
         }
-        fr_payload = {k: v for k, v in fr_payload.items() if v}
         if fr_payload:
             language_content['fr'] = fr_payload
         elif 'fr' in language_content:
@@ -309,6 +272,13 @@ class PlanImageInline(admin.TabularInline):
     fields = ['image', 'image_type', 'caption', 'display_order', 'is_primary']
     ordering = ['display_order', '-is_primary']
 
+    def get_queryset(self, request):
+        # Each row's label (PlanImage.__str__) reads plan.reference.
+        qs = super().get_queryset(request)
+        return qs.select_related('plan').only(
+            'plan__reference', 'image', 'image_type', 'caption', 'display_order', 'is_primary'
+        )
+
 
 class PlanSlugHistoryInline(admin.TabularInline):
     model = PlanSlugHistory
@@ -318,6 +288,11 @@ class PlanSlugHistoryInline(admin.TabularInline):
     readonly_fields = ['slug', 'changed_at']
     ordering = ['-changed_at']
 
+    def get_queryset(self, request):
+        # Each row's label (PlanSlugHistory.__str__) reads plan.slug.
+        qs = super().get_queryset(request)
+        return qs.select_related('plan').only('plan__slug', 'slug', 'changed_at')
+
 
 class PlanAuditLogInline(admin.TabularInline):
     model = PlanAuditLog
@@ -328,8 +303,11 @@ class PlanAuditLogInline(admin.TabularInline):
     ordering = ['-performed_at']
 
     def get_queryset(self, request):
+        # Rows show the performer's username and are labelled with plan.reference.
         qs = super().get_queryset(request)
-        return qs.select_related('performed_by')
+        return qs.select_related('plan', 'performed_by').only(
+            'plan__reference', 'performed_by__username', 'action', 'notes', 'performed_at'
+        )
 
 
 class PlanPackConfigurationInlineForm(forms.ModelForm):
@@ -337,9 +315,6 @@ class PlanPackConfigurationInlineForm(forms.ModelForm):
         model = PlanPackConfiguration
         fields = '__all__'
 
-    def clean(self):
-        return super().clean()
-
 
 class PlanPackConfigurationInline(admin.StackedInline):
     form = PlanPackConfigurationInlineForm
@@ -372,6 +347,258 @@ class PlanPackConfigurationInline(admin.StackedInline):
         return False
 
 
+# ---------- Changelist cell markup ----------
+# Most status cells depend only on a handful of states, so each variant is
+# rendered once here and reused for every row.
+
+# Paid PDF checkout states, indexed by the changelist's ``paid_pdf_tag``
+# annotation; the Case below mirrors _paid_pdf_state branch for branch.
+_PAID_PDF_STATES = ('active', 'link_needed', 'gumroad_off', 'hidden', 'none')
+_PAID_PDF_TAG = Case(
+    When(
+        Q(paid_pdf_available=True, enable_gumroad_payment=True) & ~Q(pack_2_gumroad_zip_url=''),
+        then=Value(0),
+    ),
+    When(paid_pdf_available=True, enable_gumroad_payment=True, gumroad_paid_pdf_url='', then=Value(1)),
+    When(paid_pdf_available=True, enable_gumroad_payment=False, then=Value(2)),
+    When(paid_pdf_available=False, then=Value(3)),
+    default=Value(4),
+    output_field=IntegerField(),
+)
+
+
+def _paid_pdf_state(plan):
+    tag = getattr(plan, 'paid_pdf_tag', None)
+    if tag is not None:
+        return _PAID_PDF_STATES[tag]
+    if plan.has_paid_pdf_offer:
+        return 'active'
+    if plan.paid_pdf_available and plan.enable_gumroad_payment and not plan.gumroad_paid_pdf_url:
+        return 'link_needed'
+    if plan.paid_pdf_available and not plan.enable_gumroad_payment:
+        return 'gumroad_off'
+    if not plan.paid_pdf_available:
+        return 'hidden'
+    return 'none'
+
+
+def _payment_status_html(color, icon, label, note, bold=True):
+    if bold:
+        template = (
+            '<span style="color: {}; font-weight: bold;"><i class="bi {}"></i> {}</span>'
+            '<br><small style="color: #6c757d;">{}</small>'
+        )
+    else:
+        template = '<span style="color: {};"><i class="bi {}"></i> {}</span><br><small>{}</small>'
+    return format_html(template, color, icon, label, note)
+
+
+_PAYMENT_STATUS_HTML = {
+    'active': _payment_status_html(
+        '#28a745', 'bi-check-circle-fill', 'Paid PDF active', 'Button visible on plan page'
+    ),
+    'link_needed': _payment_status_html(
+        '#ffc107', 'bi-pause-circle-fill', 'Link needed', 'Add Gumroad paid PDF link or disable the toggle'
+    ),
+    'gumroad_off': _payment_status_html(
+        '#dc3545', 'bi-exclamation-triangle-fill', 'Gumroad disabled', 'Toggle Gumroad payments on to sell the paid PDF'
+    ),
+    'hidden': _payment_status_html(
+        '#6c757d', 'bi-eye-slash', 'Paid PDF hidden', 'Free preview remains available', bold=False
+    ),
+    'none': _payment_status_html(
+        '#6c757d', 'bi-x-circle', 'No paid PDF checkout', 'Provide a Gumroad link to sell the dimensioned PDF', bold=False
+    ),
+}
+
+_GUMROAD_STATUS_HTML = {
+    'active': format_html('<span style="color: #28a745; font-weight: bold;">{}</span>', '✓ Gumroad'),
+    'link_needed': format_html('<span style="color: #dc3545; font-weight: bold;">{}</span>', '⚠ Missing link'),
+    'gumroad_off': format_html('<span style="color: #ffc107;">{}</span>', '⏸ Gumroad off'),
+    'hidden': format_html('<span style="color: #6c757d;">{}</span>', 'Hidden'),
+    'none': format_html('<span style="color: #6c757d;">{}</span>', '—'),
+}
+
+_REVIT_READY = format_html('<span style="color: #0d6efd; font-weight: bold;">{}</span>', 'RVT ready')
+_IFC_READY = format_html('<span style="color: #0f766e; font-weight: bold;">{}</span>', 'IFC ready')
+_ADDON_LINK_NEEDED = format_html('<span style="color: #dc3545;">{}</span>', 'Link needed')
+_ADDON_NONE = format_html('<span style="color: #6c757d;">{}</span>', '—')
+
+_ZIP_CONFIGURED_TEMPLATE = (
+    '<span style="color:#16a34a;font-weight:600;">Configured</span><br>'
+    '<small style="color:#0f172a;">{}</small>'
+)
+_ZIP_MISSING = format_html(
+    '<span style="color:#9ca3af;">{}</span><br><small>{}</small>', 'Missing', 'Provide Gumroad ZIP URL'
+)
+
+# Long text/JSON columns that no changelist column reads.
+_CHANGELIST_DEFERRED_FIELDS = (
+    'description',
+    'engineer_notes',
+    'architect_design_notes',
+    'revit_notes',
+    'ifc_notes',
+    'seo_description',
+    'seo_keywords',
+    'language_content',
+    'category__description',
+    'pack_configuration__pro_pack_notes',
+)
+
+_PLAN_STATUS_BADGES = {
+    state: format_html(
+        '<span style="background-color: {}; color: white; padding: 3px 8px; '
+        'border-radius: 3px; font-size: 11px; font-weight: bold; letter-spacing: 0.05em;">{}</span>',
+        color,
+        text,
+    )
+    for state, color, text in (
+        ('deleted', '#DC2626', 'Deleted'),
+        ('draft', '#4B5563', 'Draft'),
+        ('featured', '#15803D', '★ Featured'),
+        ('published', '#2563EB', 'Published'),
+        ('unpublished', '#6B7280', 'Unpublished'),
+    )
+}
+
+
+def _plan_status_state(is_deleted, publish_status, featured):
+    if is_deleted:
+        return 'deleted'
+    if publish_status == PlanPublishStatus.DRAFT:
+        return 'draft'
+    if publish_status == PlanPublishStatus.PUBLISHED:
+        return 'featured' if featured else 'published'
+    return 'unpublished'
+
+
+# Every (is_deleted, publish_status, featured) combination mapped to its badge.
+_PLAN_STATUS_BADGE_BY_STATE = {
+    key: _PLAN_STATUS_BADGES[_plan_status_state(*key)]
+    for key in itertools.product((True, False), PlanPublishStatus.values, (True, False))
+}
+
+# Every (has_free_plan, has_paid_plan, paid_pdf_available) combination.
+_FILES_STATUS_HTML = {
+    (free, paid, flag): format_html(
+        'Free: {} &nbsp; Paid: {} ({})',
+        '📄' if free else '○', '📄' if paid else '○', 'ON' if flag else 'OFF'
+    )
+    for free, paid, flag in itertools.product((True, False), repeat=3)
+}
+
+
+# Fieldset layout for the plan change form. Sections that share CSS classes
+# point at the same tuples.
+_COLLAPSED = ('collapse',)
+_PACK_FREE_CLASSES = ('pack-section', 'pack-section--free')
+_PACK_STANDARD_CLASSES = ('pack-section', 'pack-section--standard')
+_PACK_PRO_CLASSES = ('pack-section', 'pack-section--pro', 'pack-three-fields')
+
+_PLAN_FIELDSETS = (
+    ('Basic Information', {
+        'fields': (
+            ('title', 'slug'),
+            ('reference', 'category'),
+            'plan_type',
+        )
+    }),
+    ('Specifications', {
+        'fields': (
+            ('bedrooms', 'bathrooms'),
+            'floors',
+            ('total_area_sqm', 'total_area_sqft'),
+            ('suggested_plot_size', 'suggested_plot_size_ft_display'),
+            ('roof_type', 'wall_system'),
+        ),
+        'description': 'Total area in square feet and the suggested plot size in feet update automatically from the metric values.'
+    }),
+    ('Architectural Dossier', {
+        'fields': (
+            'architect_design_notes',
+            ('climate_suitability', 'plot_type'),
+            ('budget_level', 'target_user'),
+        ),
+        'description': 'Public-facing architectural notes and suitability metadata.'
+    }),
+    ('Content', {
+        'fields': ('description', 'engineer_notes')
+    }),
+    ('Localization (EN / FR)', {
+        'fields': (
+            'title_fr',
+            'description_fr',
+            'seo_title_fr',
+            'seo_description_fr',
+        ),
+        'description': 'Optional French overrides. Leave blank to reuse English content.'
+    }),
+    (Plan.PACK_DISPLAY_LABELS['free'], {
+        'fields': (
+            'free_plan_file',
+            'free_3d_image',
+            'free_3d_caption',
+        ),
+        'classes': _PACK_FREE_CLASSES,
+        'description': 'Pack 1 preview is permanently free. No pricing fields exist here and no overrides are allowed.'
+    }),
+    (Plan.PACK_DISPLAY_LABELS['standard'], {
+        'fields': (
+            'paid_pdf_available',
+            'price',
+            'pack_2_gumroad_zip_url',
+        ),
+        'classes': _PACK_STANDARD_CLASSES,
+        'description': 'Pack 2 pricing applies to both metric and imperial PDFs. Configure a single Gumroad ZIP checkout URL that already bundles Metric + Imperial deliverables.'
+    }),
+    ('Payment Configuration', {
+        'fields': (
+            'enable_gumroad_payment',
+            'payment_status_display',
+        ),
+        'description': 'Paid packs use Gumroad ZIP checkout URLs. Keep Gumroad payments enabled to show Pack 2 / Pack 3 CTAs publicly.'
+    }),
+    (Plan.PACK_DISPLAY_LABELS['pro'], {
+        'fields': (
+            'pack_3_price',
+            'pack_3_gumroad_zip_url',
+        ),
+        'classes': _PACK_PRO_CLASSES,
+        'description': 'Pack 3 stays hidden until a positive Pack 3 price is set. Configure a single Gumroad ZIP checkout URL that contains all formats (Revit/IFC/DWG) in both Metric + Imperial.'
+    }),
+    ('Pricing & Visibility', {
+        'fields': (
+            'featured',
+            'status_badge',
+            'publish_status',
+            'published_at',
+            'unpublished_at',
+            'unpublished_by',
+            'unpublished_reason',
+            'is_deleted',
+            'deleted_at',
+            'deleted_by',
+            'last_modified_by',
+        ),
+        'description': 'Use the admin actions to publish, unpublish, soft delete, restore, or hard delete plans.'
+    }),
+    ('SEO', {
+        'fields': ('seo_title', 'seo_description', 'seo_keywords'),
+        'classes': _COLLAPSED,
+        'description': 'Custom SEO fields. Leave blank to use auto-generated values.'
+    }),
+    ('Statistics', {
+        'fields': (
+            ('views_count', 'downloads_count'),
+            ('created_at', 'updated_at'),
+        ),
+        'classes': _COLLAPSED,
+        'description': 'Read-only statistics and metadata.'
+    }),
+)
+
+
 @admin.register(Plan)
 class PlanAdmin(admin.ModelAdmin):
     """Restricted superuser-only admin for full plan lifecycle control."""
@@ -430,6 +657,11 @@ class PlanAdmin(admin.ModelAdmin):
         'last_modified_by',
         'payment_status_display',
     ]
+    # Searchable picker instead of a <select> holding every category; the
+    # user foreign keys above are read-only and never render a widget.
+    autocomplete_fields = ['category']
+    # Joined for list columns and the change form alike (see get_queryset)
+    list_select_related = ('category', 'pack_configuration', 'last_modified_by', 'deleted_by', 'unpublished_by')
     list_per_page = 25
     date_hierarchy = 'created_at'
     ordering = ['-created_at']
@@ -444,107 +676,7 @@ class PlanAdmin(admin.ModelAdmin):
             'all': ('css/admin_plan_filter_sidebar.css',)
         }
 
-    fieldsets = (
-        ('Basic Information', {
-            'fields': (
-                ('title', 'slug'),
-                ('reference', 'category'),
-                'plan_type',
-            )
-        }),
-        ('Specifications', {
-            'fields': (
-                ('bedrooms', 'bathrooms'),
-                'floors',
-                ('total_area_sqm', 'total_area_sqft'),
-                ('suggested_plot_size', 'suggested_plot_size_ft_display'),
-                ('roof_type', 'wall_system'),
-            ),
-            'description': 'Total area in square feet and the suggested plot size in feet update automatically from the metric values.'
-        }),
-        ('Architectural Dossier', {
-            'fields': (
-                'architect_design_notes',
-                ('climate_suitability', 'plot_type'),
-                ('budget_level', 'target_user'),
-            ),
-            'description': 'Public-facing architectural notes and suitability metadata.'
-        }),
-        ('Content', {
-            'fields': ('description', 'engineer_notes')
-        }),
-        ('Localization (EN / FR)', {
-            'fields': (
-                'title_fr',
-                'description_fr',
-                'seo_title_fr',
-                'seo_description_fr',
-            ),
-            'description': 'Optional French overrides. Leave blank to reuse English content.'
-        }),
-            (Plan.PACK_DISPLAY_LABELS['free'], {
-                'fields': (
-                    'free_plan_file',
-                    'free_3d_image',
-                    'free_3d_caption',
-                ),
-                'classes': ('pack-section', 'pack-section--free'),
-                'description': 'Pack 1 preview is permanently free. No pricing fields exist here and no overrides are allowed.'
-            }),
-            (Plan.PACK_DISPLAY_LABELS['standard'], {
-                'fields': (
-                    'paid_pdf_available',
-                    'price',
-                    'pack_2_gumroad_zip_url',
-                ),
-                'classes': ('pack-section', 'pack-section--standard'),
-                'description': 'Pack 2 pricing applies to both metric and imperial PDFs. Configure a single Gumroad ZIP checkout URL that already bundles Metric + Imperial deliverables.'
-            }),
-        ('Payment Configuration', {
-            'fields': (
-                'enable_gumroad_payment',
-                'payment_status_display',
-            ),
-            'description': 'Paid packs use Gumroad ZIP checkout URLs. Keep Gumroad payments enabled to show Pack 2 / Pack 3 CTAs publicly.'
-        }),
-        (Plan.PACK_DISPLAY_LABELS['pro'], {
-            'fields': (
-                'pack_3_price',
-                'pack_3_gumroad_zip_url',
-            ),
-            'classes': ('pack-section', 'pack-section--pro', 'pack-three-fields'),
-            'description': 'Pack 3 stays hidden until a positive Pack 3 price is set. Configure a single Gumroad ZIP checkout URL that contains all formats (Revit/IFC/DWG) in both Metric + Imperial.'
-        }),
-        ('Pricing & Visibility', {
-            'fields': (
-                'featured',
-                'status_badge',
-                'publish_status',
-                'published_at',
-                'unpublished_at',
-                'unpublished_by',
-                'unpublished_reason',
-                'is_deleted',
-                'deleted_at',
-                'deleted_by',
-                'last_modified_by',
-            ),
-            'description': 'Use the admin actions to publish, unpublish, soft delete, restore, or hard delete plans.'
-        }),
-        ('SEO', {
-            'fields': ('seo_title', 'seo_description', 'seo_keywords'),
-            'classes': ('collapse',),
-            'description': 'Custom SEO fields. Leave blank to use auto-generated values.'
-        }),
-        ('Statistics', {
-            'fields': (
-                ('views_count', 'downloads_count'),
-                ('created_at', 'updated_at'),
-            ),
-            'classes': ('collapse',),
-            'description': 'Read-only statistics and metadata.'
-        }),
-    )
+    fieldsets = _PLAN_FIELDSETS
 
     def get_urls(self):
         urls = super().get_urls()
@@ -572,8 +704,16 @@ class PlanAdmin(admin.ModelAdmin):
         ]
         return custom_urls + urls
 
+    def get_object(self, request, object_id, from_field=None):
+        # changeform_view already loaded this plan for its extra context
+        cached = getattr(request, '_plan_admin_object', None)
+        if cached is not None and from_field is None and str(cached.pk) == str(object_id):
+            return cached
+        return super().get_object(request, object_id, from_field)
+
     def changeform_view(self, request, object_id=None, form_url='', extra_context=None):
         plan_instance = self.get_object(request, object_id) if object_id else None
+        request._plan_admin_object = plan_instance
         if request.method == 'POST' and '_cancel' in request.POST:
             self.message_user(request, 'Changes discarded. No updates applied.', level=messages.INFO)
             return redirect('admin:plans_plan_changelist')
@@ -616,105 +756,31 @@ class PlanAdmin(admin.ModelAdmin):
 
     def payment_status_display(self, obj):
         """Display Gumroad payment status with visual indicator and warnings."""
-        if obj.has_paid_pdf_offer:
-            return format_html(
-                '<span style="color: #28a745; font-weight: bold;">'
-                '<i class="bi bi-check-circle-fill"></i> {}</span>'
-                '<br><small style="color: #6c757d;">{}</small>',
-                'Paid PDF active',
-                'Button visible on plan page'
-            )
-        elif obj.paid_pdf_available and obj.enable_gumroad_payment and not obj.gumroad_paid_pdf_url:
-            return format_html(
-                '<span style="color: #ffc107; font-weight: bold;">'
-                '<i class="bi bi-pause-circle-fill"></i> {}</span>'
-                '<br><small style="color: #6c757d;">{}</small>',
-                'Link needed',
-                'Add Gumroad paid PDF link or disable the toggle'
-            )
-        elif obj.paid_pdf_available and not obj.enable_gumroad_payment:
-            return format_html(
-                '<span style="color: #dc3545; font-weight: bold;">'
-                '<i class="bi bi-exclamation-triangle-fill"></i> {}</span>'
-                '<br><small style="color: #6c757d;">{}</small>',
-                'Gumroad disabled',
-                'Toggle Gumroad payments on to sell the paid PDF'
-            )
-        elif not obj.paid_pdf_available:
-            return format_html(
-                '<span style="color: #6c757d;">'
-                '<i class="bi bi-eye-slash"></i> {}</span>'
-                '<br><small>{}</small>',
-                'Paid PDF hidden',
-                'Free preview remains available'
-            )
-        else:
-            return format_html(
-                '<span style="color: #6c757d;">'
-                '<i class="bi bi-x-circle"></i> {}</span>'
-                '<br><small>{}</small>',
-                'No paid PDF checkout',
-                'Provide a Gumroad link to sell the dimensioned PDF'
-            )
+        return _PAYMENT_STATUS_HTML[_paid_pdf_state(obj)]
     payment_status_display.short_description = 'Payment Status'
 
     def gumroad_status(self, obj):
         """Quick visual indicator for Gumroad payment status in list view."""
-        if obj.has_paid_pdf_offer:
-            return format_html(
-                '<span style="color: #28a745; font-weight: bold;">{}</span>',
-                '✓ Gumroad'
-            )
-        elif obj.paid_pdf_available and obj.enable_gumroad_payment and not obj.gumroad_paid_pdf_url:
-            return format_html(
-                '<span style="color: #dc3545; font-weight: bold;">{}</span>',
-                '⚠ Missing link'
-            )
-        elif obj.paid_pdf_available and not obj.enable_gumroad_payment:
-            return format_html(
-                '<span style="color: #ffc107;">{}</span>',
-                '⏸ Gumroad off'
-            )
-        elif not obj.paid_pdf_available:
-            return format_html(
-                '<span style="color: #6c757d;">{}</span>',
-                'Hidden'
-            )
-        else:
-            return format_html(
-                '<span style="color: #6c757d;">{}</span>',
-                '—'
-            )
+        return _GUMROAD_STATUS_HTML[_paid_pdf_state(obj)]
     gumroad_status.short_description = 'Gumroad'
+    gumroad_status.admin_order_field = 'paid_pdf_tag'
 
     def revit_status(self, obj):
         """Surface optional Revit add-on availability."""
         if obj.has_revit_offer:
-            return format_html(
-                '<span style="color: #0d6efd; font-weight: bold;">{}</span>',
-                'RVT ready'
-            )
+            return _REVIT_READY
         if obj.revit_available and not obj.gumroad_revit_url:
-            return format_html(
-                '<span style="color: #dc3545;">{}</span>',
-                'Link needed'
-            )
-        return format_html('<span style="color: #6c757d;">{}</span>', '—')
+            return _ADDON_LINK_NEEDED
+        return _ADDON_NONE
     revit_status.short_description = 'Revit'
 
     def ifc_status(self, obj):
         """Surface optional IFC add-on availability."""
         if obj.has_ifc_offer:
-            return format_html(
-                '<span style="color: #0f766e; font-weight: bold;">{}</span>',
-                'IFC ready'
-            )
+            return _IFC_READY
         if obj.ifc_available and not obj.gumroad_ifc_url:
-            return format_html(
-                '<span style="color: #dc3545;">{}</span>',
-                'Link needed'
-            )
-        return format_html('<span style="color: #6c757d;">{}</span>', '—')
+            return _ADDON_LINK_NEEDED
+        return _ADDON_NONE
     ifc_status.short_description = 'IFC'
 
     def pack2_delivery_status(self, obj):
@@ -727,45 +793,22 @@ class PlanAdmin(admin.ModelAdmin):
 
     def _render_gumroad_zip_status(self, url, label):
         if url:
-            return format_html(
-                '<span style="color:#16a34a;font-weight:600;">Configured</span><br>'
-                '<small style="color:#0f172a;">{}</small>',
-                url
-            )
-        return format_html('<span style="color:#9ca3af;">{}</span><br><small>{}</small>', 'Missing', 'Provide Gumroad ZIP URL')
+            return format_html(_ZIP_CONFIGURED_TEMPLATE, url)
+        return _ZIP_MISSING
 
     def status_badge(self, obj):
         """Visual badge reflecting publish / delete state."""
-        if obj.is_deleted:
-            color = '#DC2626'
-            text = 'Deleted'
-        elif obj.publish_status == PlanPublishStatus.DRAFT:
-            color = '#4B5563'
-            text = 'Draft'
-        elif obj.publish_status == PlanPublishStatus.PUBLISHED:
-            color = '#15803D' if obj.featured else '#2563EB'
-            text = '★ Featured' if obj.featured else 'Published'
-        else:
-            color = '#6B7280'
-            text = 'Unpublished'
-
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 8px; '
-            'border-radius: 3px; font-size: 11px; font-weight: bold; letter-spacing: 0.05em;">{}</span>',
-            color,
-            text,
+        badge = _PLAN_STATUS_BADGE_BY_STATE.get(
+            (obj.is_deleted, obj.publish_status, bool(obj.featured))
         )
+        if badge is None:
+            badge = _PLAN_STATUS_BADGES[_plan_status_state(obj.is_deleted, obj.publish_status, obj.featured)]
+        return badge
     status_badge.short_description = 'Status'
 
     def files_status(self, obj):
         """Show which files are uploaded."""
-        free_icon = '📄' if obj.has_free_plan else '○'
-        paid_icon = '📄' if obj.has_paid_plan else '○'
-        paid_flag = 'ON' if obj.paid_pdf_available else 'OFF'
-        return format_html(
-            'Free: {} &nbsp; Paid: {} ({})',
-            free_icon, paid_icon, paid_flag
-        )
+        return _FILES_STATUS_HTML[obj.has_free_plan, obj.has_paid_plan, bool(obj.paid_pdf_available)]
     files_status.short_description = 'Files'
 
     def pricing_summary(self, obj):
@@ -908,8 +951,16 @@ class PlanAdmin(admin.ModelAdmin):
 
     # ---------- Query / Save Overrides ----------
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.select_related('category', 'pack_configuration', 'last_modified_by', 'deleted_by', 'unpublished_by')
+        qs = super().get_queryset(request).select_related(*self.list_select_related)
+        match = request.resolver_match
+        if match and match.url_name == 'plans_plan_changelist':
+            # The Gumroad column reads (and sorts by) a database-computed tag.
+            qs = qs.annotate(paid_pdf_tag=_PAID_PDF_TAG)
+            # The list page never shows long-form copy; bulk actions (POST) keep
+            # full rows because publish/soft delete work on whole plans.
+            if request.method == 'GET':
+                qs = qs.defer(*_CHANGELIST_DEFERRED_FIELDS)
+        return qs
 
     def save_model(self, request, obj, form, change):
         obj.last_modified_by = request.user
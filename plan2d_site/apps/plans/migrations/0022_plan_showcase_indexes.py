@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plans', '0021_plan_pack_3_price_alter_plan_price'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='plan',
+            index=models.Index(condition=models.Q(('price__gt', 0), models.Q(('pack_2_gumroad_zip_url', ''), _negated=True)), fields=['price'], name='plan_pack2_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='plan',
+            index=models.Index(condition=models.Q(('pack_3_price__gt', 0), models.Q(('pack_3_gumroad_zip_url', ''), _negated=True)), fields=['pack_3_price'], name='plan_pack3_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='plan',
+            index=models.Index(fields=['-featured', '-created_at'], name='plan_featured_created_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:28
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plans', '0022_plan_showcase_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='plan',
+            name='gumroad_ifc_url',
+            field=models.URLField(blank=True, help_text='Gumroad checkout link for the IFC file. Payments remain on Gumroad.', max_length=500, validators=[django.core.validators.RegexValidator('^https://(?:[a-z0-9-]+\\.)*gumroad\\.com/', code='invalid_gumroad_url', flags=re.RegexFlag['IGNORECASE'], message='Please enter a valid Gumroad URL. URL must start with https://gumroad.com/ or https://*.gumroad.com/')]),
+        ),
+        migrations.AlterField(
+            model_name='plan',
+            name='gumroad_paid_pdf_url',
+            field=models.URLField(blank=True, help_text='Optional Gumroad link dedicated to the paid PDF checkout.', max_length=500, validators=[django.core.validators.RegexValidator('^https://(?:[a-z0-9-]+\\.)*gumroad\\.com/', code='invalid_gumroad_url', flags=re.RegexFlag['IGNORECASE'], message='Please enter a valid Gumroad URL. URL must start with https://gumroad.com/ or https://*.gumroad.com/')]),
+        ),
+        migrations.AlterField(
+            model_name='plan',
+            name='gumroad_revit_url',
+            field=models.URLField(blank=True, help_text='Gumroad checkout link for the Revit (.RVT) file. Payments remain on Gumroad.', max_length=500, validators=[django.core.validators.RegexValidator('^https://(?:[a-z0-9-]+\\.)*gumroad\\.com/', code='invalid_gumroad_url', flags=re.RegexFlag['IGNORECASE'], message='Please enter a valid Gumroad URL. URL must start with https://gumroad.com/ or https://*.gumroad.com/')]),
+        ),
+        migrations.AlterField(
+            model_name='plan',
+            name='gumroad_url',
+            field=models.URLField(blank=True, help_text='Gumroad checkout link for the paid version of this plan (e.g., https://gumroad.com/l/your-product)', max_length=500, validators=[django.core.validators.RegexValidator('^https://(?:[a-z0-9-]+\\.)*gumroad\\.com/', code='invalid_gumroad_url', flags=re.RegexFlag['IGNORECASE'], message='Please enter a valid Gumroad URL. URL must start with https://gumroad.com/ or https://*.gumroad.com/')]),
+        ),
+        migrations.AlterField(
+            model_name='plan',
+            name='pack_2_gumroad_zip_url',
+            field=models.URLField(blank=True, help_text='Single Gumroad ZIP delivering Pack 2 (contains both Metric and Imperial PDFs).', max_length=500, validators=[django.core.validators.RegexValidator('^https://(?:[a-z0-9-]+\\.)*gumroad\\.com/', code='invalid_gumroad_url', flags=re.RegexFlag['IGNORECASE'], message='Gumroad ZIP URL must start with https://gumroad.com/ or https://*.gumroad.com/')], verbose_name='Pack 2 Gumroad ZIP URL'),
+        ),
+        migrations.AlterField(
+            model_name='plan',
+            name='pack_3_gumroad_zip_url',
+            field=models.URLField(blank=True, help_text='Single Gumroad ZIP delivering Pack 3 (Metric + Imperial Revit/IFC/DWG).', max_length=500, validators=[django.core.validators.RegexValidator('^https://(?:[a-z0-9-]+\\.)*gumroad\\.com/', code='invalid_gumroad_url', flags=re.RegexFlag['IGNORECASE'], message='Gumroad ZIP URL must start with https://gumroad.com/ or https://*.gumroad.com/')], verbose_name='Pack 3 Gumroad ZIP URL'),
+        ),
+    ]
@@ -1,13 +1,17 @@
 import logging
+import re
+from collections import namedtuple
 from pathlib import Path
 
 from django.apps import apps
 from django.db import models, transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
 from django.core.files.storage import default_storage
-from django.core.validators import MinValueValidator, FileExtensionValidator
+from django.core.validators import MinValueValidator, FileExtensionValidator, RegexValidator
 from django.urls import reverse
 from django.conf import settings
 from decimal import Decimal, ROUND_HALF_UP
@@ -22,6 +26,42 @@ class PlanPublishStatus(models.TextChoices):
     PUBLISHED = 'published', 'Published'
 
 
+# Checkout links must point at gumroad.com or one of its subdomains. The own
+# error code keeps URLField's generic 'invalid' message from replacing ours.
+_GUMROAD_URL_REGEX = r'^https://(?:[a-z0-9-]+\.)*gumroad\.com/'
+_GUMROAD_URL_RE = re.compile(_GUMROAD_URL_REGEX, re.IGNORECASE)
+_GUMROAD_URL_RULE = 'must start with https://gumroad.com/ or https://*.gumroad.com/'
+validate_gumroad_url = RegexValidator(
+    _GUMROAD_URL_REGEX,
+    message=f'Please enter a valid Gumroad URL. URL {_GUMROAD_URL_RULE}',
+    code='invalid_gumroad_url',
+    flags=re.IGNORECASE,
+)
+validate_gumroad_zip_url = RegexValidator(
+    _GUMROAD_URL_REGEX,
+    message=f'Gumroad ZIP URL {_GUMROAD_URL_RULE}',
+    code='invalid_gumroad_url',
+    flags=re.IGNORECASE,
+)
+
+
+def _gumroad_ok(url):
+    return bool(_GUMROAD_URL_RE.match(url))
+
+
+# Columns read by plans/_plan_card.html (directly or through Plan
+# properties); keep in sync with the template to avoid deferred loads.
+SHOWCASE_CARD_FIELDS = (
+    'slug', 'title', 'reference', 'plan_type', 'bedrooms', 'bathrooms',
+    'total_area_sqm', 'floors', 'free_plan_file', 'paid_pdf_available',
+    'enable_gumroad_payment', 'pack_2_gumroad_zip_url',
+    'pack_3_gumroad_zip_url', 'pack_3_price', 'seo_description',
+    'featured', 'created_at', 'category__slug', 'category__name',
+)
+
+HomepageShowcase = namedtuple('HomepageShowcase', ['plans', 'pack2_min_price', 'pack3_min_price'])
+
+
 class PlanQuerySet(models.QuerySet):
     """Reusable queryset helpers for plan visibility rules."""
 
@@ -43,6 +83,43 @@ class PlanQuerySet(models.QuerySet):
         """Plans that can be shown publicly."""
         return self.published()
 
+    def showcase_cards(self):
+        """Visible plans loaded with just what plans/_plan_card.html renders."""
+        return (
+            self.visible()
+            .select_related('category')
+            .only(*SHOWCASE_CARD_FIELDS)
+            .prefetch_related(
+                models.Prefetch(
+                    'images',
+                    queryset=PlanImage.objects.primary_per_plan().only('id', 'plan_id', 'image'),
+                    to_attr='primary_image_list',
+                )
+            )
+            .order_by('-featured', '-created_at')
+        )
+
+    def homepage_showcase(self, limit=6):
+        """
+        Featured-first plan cards plus the "From $X" pack prices.
+
+        Ordering by -featured puts featured plans first; recent non-featured
+        plans fill any remaining slots so the showcase is never empty.
+        """
+        plans = list(self.showcase_cards()[:limit])
+        # Both pack prices in one scan of the visible plans.
+        min_prices = self.visible().aggregate(
+            pack2=models.Min(
+                'price',
+                filter=models.Q(price__gt=0) & ~models.Q(pack_2_gumroad_zip_url=''),
+            ),
+            pack3=models.Min(
+                'pack_3_price',
+                filter=models.Q(pack_3_price__gt=0) & ~models.Q(pack_3_gumroad_zip_url=''),
+            ),
+        )
+        return HomepageShowcase(plans, min_prices['pack2'], min_prices['pack3'])
+
 
 class PlanManager(models.Manager):
     """Default manager exposing custom queryset helpers."""
@@ -65,6 +142,12 @@ class PlanManager(models.Manager):
     def visible(self):
         return self.get_queryset().visible()
 
+    def showcase_cards(self):
+        return self.get_queryset().showcase_cards()
+
+    def homepage_showcase(self, limit=6):
+        return self.get_queryset().homepage_showcase(limit=limit)
+
 
 class Category(models.Model):
     """
@@ -292,11 +375,13 @@ class Plan(models.Model):
     gumroad_paid_pdf_url = models.URLField(
         blank=True,
         max_length=500,
+        validators=[validate_gumroad_url],
         help_text="Optional Gumroad link dedicated to the paid PDF checkout."
     )
     pack_2_gumroad_zip_url = models.URLField(
         blank=True,
         max_length=500,
+        validators=[validate_gumroad_zip_url],
         verbose_name="Pack 2 Gumroad ZIP URL",
         help_text="Single Gumroad ZIP delivering Pack 2 (contains both Metric and Imperial PDFs)."
     )
@@ -315,6 +400,7 @@ class Plan(models.Model):
     gumroad_url = models.URLField(
         blank=True,
         max_length=500,
+        validators=[validate_gumroad_url],
         help_text="Gumroad checkout link for the paid version of this plan (e.g., https://gumroad.com/l/your-product)"
     )
     enable_gumroad_payment = models.BooleanField(
@@ -330,6 +416,7 @@ class Plan(models.Model):
     gumroad_revit_url = models.URLField(
         blank=True,
         max_length=500,
+        validators=[validate_gumroad_url],
         help_text="Gumroad checkout link for the Revit (.RVT) file. Payments remain on Gumroad."
     )
     revit_version = models.CharField(
@@ -358,6 +445,7 @@ class Plan(models.Model):
     gumroad_ifc_url = models.URLField(
         blank=True,
         max_length=500,
+        validators=[validate_gumroad_url],
         help_text="Gumroad checkout link for the IFC file. Payments remain on Gumroad."
     )
     ifc_price = models.DecimalField(
@@ -380,6 +468,7 @@ class Plan(models.Model):
     pack_3_gumroad_zip_url = models.URLField(
         blank=True,
         max_length=500,
+        validators=[validate_gumroad_zip_url],
         verbose_name="Pack 3 Gumroad ZIP URL",
         help_text="Single Gumroad ZIP delivering Pack 3 (Metric + Imperial Revit/IFC/DWG)."
     )
@@ -494,6 +583,19 @@ class Plan(models.Model):
             models.Index(fields=['publish_status', '-created_at']),
             models.Index(fields=['category', 'publish_status']),
             models.Index(fields=['is_deleted', 'publish_status']),
+            # Homepage showcase: MIN(price) over plans that sell a pack, and
+            # the featured-first ordering of the plan cards.
+            models.Index(
+                fields=['price'],
+                name='plan_pack2_price_idx',
+                condition=models.Q(price__gt=0) & ~models.Q(pack_2_gumroad_zip_url=''),
+            ),
+            models.Index(
+                fields=['pack_3_price'],
+                name='plan_pack3_price_idx',
+                condition=models.Q(pack_3_price__gt=0) & ~models.Q(pack_3_gumroad_zip_url=''),
+            ),
+            models.Index(fields=['-featured', '-created_at'], name='plan_featured_created_idx'),
         ]
 
     def __str__(self):
@@ -730,6 +832,11 @@ class Plan(models.Model):
         """Check if paid plan is available."""
         return bool(self.paid_plan_file)
 
+    @property
+    def download_filename(self):
+        """Attachment name for the paid PDF sent to buyers."""
+        return f"{self.reference}-{self.slug}.pdf"
+
     @property
     def has_revit_offer(self):
         """True when Pack 3 is available (priced + ZIP configured)."""
@@ -805,6 +912,14 @@ class Plan(models.Model):
         if hasattr(self, cache_key):
             return getattr(self, cache_key)
 
+        # Listing pages may prefetch just the winning image per plan (see
+        # PlanImage.objects.primary_per_plan) into ``primary_image_list``.
+        prefetched = getattr(self, 'primary_image_list', None)
+        if prefetched is not None:
+            primary = prefetched[0] if prefetched else None
+            setattr(self, cache_key, primary)
+            return primary
+
         images = self._get_image_sequence()
         primary = next((image for image in images if image.is_primary), None)
         if not primary and images:
@@ -1127,11 +1242,8 @@ class Plan(models.Model):
             return
         cleaned = url_value.strip()
         setattr(self, field_name, cleaned)
-        if not (cleaned.startswith('https://gumroad.com/') or (
-                cleaned.startswith('https://') and '.gumroad.com/' in cleaned)):
-            raise ValidationError({
-                field_name: 'Gumroad URL must start with https://gumroad.com/ or https://*.gumroad.com/'
-            })
+        if not _gumroad_ok(cleaned):
+            raise ValidationError({field_name: f'Gumroad URL {_GUMROAD_URL_RULE}'})
 
 
 class PlanPackConfiguration(models.Model):
@@ -1212,6 +1324,18 @@ class PlanPackConfiguration(models.Model):
         return self.dwg_file_label or 'Download DWG'
 
 
+class PlanImageQuerySet(models.QuerySet):
+    def primary_per_plan(self):
+        """One image per plan: the same pick as Plan.get_primary_image()."""
+        return self.alias(
+            plan_rank=Window(
+                RowNumber(),
+                partition_by=F('plan_id'),
+                order_by=[F('is_primary').desc(), F('display_order').asc(), F('created_at').desc()],
+            )
+        ).filter(plan_rank=1)
+
+
 class PlanImage(models.Model):
     """
     Images associated with a plan (floor plans, elevations, 3D renders, etc.).
@@ -1254,6 +1378,8 @@ class PlanImage(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = PlanImageQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Plan Image"
         verbose_name_plural = "Plan Images"
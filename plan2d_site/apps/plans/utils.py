@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Optional
 
 PLOT_SIZE_PATTERN = re.compile(r"^(?P<width>\d+(?:\.\d+)?)x(?P<depth>\d+(?:\.\d+)?)$")
@@ -64,6 +65,15 @@ def convert_plot_size_to_feet(dimensions: tuple[Decimal, Decimal]) -> tuple[Deci
 
 
 def build_plot_size_conversion(raw_value: Optional[str]) -> Optional[PlotSizeConversion]:
+    if not raw_value:
+        return None
+    return _build_plot_size_conversion(raw_value.strip())
+
+
+# Plot sizes repeat across plans and the result is immutable, so parse each
+# distinct string once per process.
+@lru_cache(maxsize=1024)
+def _build_plot_size_conversion(raw_value: str) -> Optional[PlotSizeConversion]:
     dimensions_m = parse_plot_size_meters(raw_value)
     if not dimensions_m:
         return None
@@ -203,9 +203,33 @@ ADMIN_WHATSAPP = '+22796380877'
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
 
+# Send notification emails from a background thread after the request commits
+NOTIFICATIONS_ASYNC = True
+
+# Record sends in EmailLog. None means "only for backends that deliver mail"
+# (console, locmem and dummy sends are not logged).
+NOTIFICATIONS_PERSIST_LOG = None
+
 # Allowed file types for contact form
 CONTACT_ALLOWED_FILE_TYPES = ['pdf', 'jpg', 'jpeg', 'png', 'zip']
 
+# Contact form abuse guards: reject bodies larger than the attachment limit
+# plus form overhead, and cap submissions per client IP per hour (0 disables).
+CONTACT_MAX_REQUEST_SIZE = FILE_UPLOAD_MAX_MEMORY_SIZE + 65536
+CONTACT_RATE_LIMIT = 10
+
+# Reverse proxies in front of the app that append to X-Forwarded-For. The rate
+# limiter keys on the address the outermost trusted proxy saw; anything before
+# it in the header is client-supplied. 0 means REMOTE_ADDR is the client.
+TRUSTED_PROXY_COUNT = int(os.getenv('TRUSTED_PROXY_COUNT', '0'))
+
+# Paid plan downloads. When nginx fronts the app, set this so the view only
+# checks access and replies with X-Accel-Redirect; nginx then serves the file
+# from an internal location, e.g.
+#   location /protected-media/ { internal; alias /path/to/media/; }
+DOWNLOAD_X_ACCEL_REDIRECT = _env_bool('DOWNLOAD_X_ACCEL_REDIRECT', False)
+DOWNLOAD_X_ACCEL_PREFIX = os.getenv('DOWNLOAD_X_ACCEL_PREFIX', '/protected-media/')
+
 # ----------------------------
 # Privacy-respecting analytics
 # ----------------------------
@@ -213,6 +237,8 @@ CONTACT_ALLOWED_FILE_TYPES = ['pdf', 'jpg', 'jpeg', 'png', 'zip']
 # Never stores IP addresses or personal identifiers.
 ANALYTICS_ENABLED = True
 ANALYTICS_THROTTLE_SECONDS = 60
+# Write visits from a background thread in batches instead of on the request path.
+ANALYTICS_BUFFERED_WRITES = True
 
 # Optional GeoIP2 support:
 # If you download a GeoLite2 Country database (mmdb), set GEOIP_PATH to the folder path.